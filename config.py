@@ -342,6 +342,10 @@ PLOT_DEFAULTS: Dict[str, bool] = {
     "errorI": False,
 }
 
+# Opt-in OpenCV-rendered live plot for resource-constrained targets.
+# Requires opencv-python (cv2) and NumPy; falls back to matplotlib otherwise.
+FAST_PLOT_MODE: Final[bool] = False
+
 
 # ==============================================================================
 # HELPER FUNCTIONS
@@ -398,7 +402,7 @@ __all__ = [
     "MOTOR_SPECS", "VFD_SPECS", "ENCODER_SPECS",
     "SYMPTOM_DIAGNOSIS",
     "HARDWARE_CHECKLIST", "COMMISSIONING_CHECKLIST",
-    "PLOT_TRACES", "PLOT_DEFAULTS",
+    "PLOT_TRACES", "PLOT_DEFAULTS", "FAST_PLOT_MODE",
     "MotorSpecs", "VfdSpecs", "EncoderSpecs",
     "Preset", "PresetCollection",
     "get_baseline_params", "get_preset", "list_presets", "get_monitor_pin",
@@ -31,16 +31,23 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 from typing import Any, Dict, Callable, Optional, List
 from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from bisect import bisect_left, bisect_right
+from functools import partial
+from itertools import islice, zip_longest
+import queue
+import threading
 import time
 import csv
 
 from config import (
     TUNING_PARAMS, BASELINE_PARAMS, PRESETS,
-    PLOT_TRACES, PLOT_DEFAULTS, HISTORY_DURATION_S,
+    PLOT_TRACES, PLOT_DEFAULTS, HISTORY_DURATION_S, UPDATE_HZ,
+    FAST_PLOT_MODE,
 )
 
-# Matplotlib imports
+# Matplotlib imports (Agg rendering into Tk; never TkCairo)
 try:
     import matplotlib
     matplotlib.use('TkAgg')
@@ -51,6 +58,40 @@ try:
 except ImportError:
     HAS_MATPLOTLIB = False
 
+# From matplotlib 3.5 the TkAgg blit goes through Tk_PhotoPutBlock with the
+# GIL released, so the HAL thread keeps running while the plot blits. Older
+# versions work but blit noticeably slower.
+MATPLOTLIB_MIN_VERSION = (3, 5)
+
+
+def matplotlib_version_ok() -> bool:
+    """True when matplotlib is available and new enough for the fast blit path."""
+    if not HAS_MATPLOTLIB:
+        return False
+    try:
+        version = tuple(int(part) for part in matplotlib.__version__.split('.')[:2])
+    except ValueError:
+        return True  # Unparseable dev build; assume recent
+    return version >= MATPLOTLIB_MIN_VERSION
+
+
+# NumPy is optional (always present alongside matplotlib); it is only used by
+# the plot and plot-data export paths.
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# OpenCV is optional; used only by the FAST_PLOT_MODE renderer (needs NumPy)
+try:
+    import cv2
+    HAS_CV2 = HAS_NUMPY
+except ImportError:
+    cv2 = None
+    HAS_CV2 = False
+
 
 # =============================================================================
 # CONSTANTS
@@ -62,57 +103,236 @@ ERROR_THRESHOLD_GOOD = 25
 ERROR_THRESHOLD_WARNING = 50
 ERROR_THRESHOLD_CRITICAL = 100
 
+# Color bands indexed by bisect over ERROR_BANDS (one entry per band, plus
+# the "above WARNING" band). The meter uses strict "<" bands (bisect_right),
+# the readout label inclusive "<=" bands (bisect_left).
+ERROR_BANDS = (ERROR_THRESHOLD_EXCELLENT, ERROR_THRESHOLD_GOOD, ERROR_THRESHOLD_WARNING)
+ERROR_METER_COLORS = ("green", "#88AA00", "orange", "red")  # #88AA00 = yellow-green
+ERROR_LABEL_COLORS = ("green", "blue", "orange", "red")
+
+# Stability rating from the stats window's error range (max - min, RPM)
+STABILITY_BANDS = (10, 25, 50)
+STABILITY_LABELS = (
+    ("Excellent", "green"),
+    ("Good", "blue"),
+    ("Fair", "orange"),
+    ("Poor", "red"),
+)
+
+# Fast-rendering matplotlib settings for low-power targets (Raspberry Pi):
+# aggressive path simplification and chunked Agg paths cut rasterization cost
+PLOT_RC_PARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'lines.antialiased': False,
+}
+
+# Per-trace line style (no antialiasing, cheap miter joins)
+PLOT_LINE_STYLE = {
+    'linewidth': 1.5,
+    'antialiased': False,
+    'solid_joinstyle': 'miter',
+}
+
+# Fast (OpenCV) plot: image size in pixels and RGB trace colors
+FAST_PLOT_SIZE = (800, 400)
+FAST_PLOT_COLORS = {
+    'blue': (0, 0, 255),
+    'green': (0, 128, 0),
+    'red': (255, 0, 0),
+    'orange': (255, 165, 0),
+}
+
+# Rows per writerows() call when exporting plot data to CSV
+CSV_EXPORT_BATCH_ROWS = 1024
+
+# How often the Tk thread checks for a finished plot-data export (ms)
+CSV_EXPORT_POLL_MS = 50
+
+# Text telemetry (no-matplotlib fallback): one format string per line
+TEXT_FALLBACK_TEMPLATE = (
+    "Time: {time}",
+    "Cmd:       {cmd:8.0f} RPM",
+    "Feedback:  {fb:8.0f} RPM",
+    "Error:     {err:8.1f} RPM",
+    "Integrator: {errI:8.1f}",
+    "PID Out:   {out:8.1f}",
+    "Revs:      {revs:8.2f}",
+)
+
+# Direction indicator: |feedback_raw| below this (RPM) reads as stopped
+DIRECTION_STOP_RPM = 10
+
+# Direction indicator (text, color) keyed by sign of feedback_raw
+DIRECTION_DISPLAY = {
+    0: ("STOP", "gray"),
+    1: ("CW →", "green"),
+    -1: ("← CCW", "blue"),
+}
+
 # Time scale options for plot (seconds)
 TIME_SCALE_OPTIONS = [10, 30, 60, 120]
 
 # Statistics window (seconds)
 STATS_WINDOW_S = 5.0
 
+# Refresh rate for slow-changing readouts (stats panel, integrator, VFD %/Hz).
+# Human readability caps around 5 Hz, so these skip ticks at higher rates.
+SLOW_REFRESH_HZ = 5.0
+
+# Plot refresh decimation: redraw the plot every Nth update() tick. "Low CPU"
+# mode trades plot smoothness for headroom on slow targets; numeric readouts
+# always update at the full UPDATE_HZ.
+PLOT_DECIMATION_SMOOTH = 1
+PLOT_DECIMATION_LOW_CPU = 5
+
+
+# =============================================================================
+# PARAMETER SPEC
+# =============================================================================
+
+@dataclass(frozen=True)
+class ParamSpec:
+    """Resolved per-parameter metadata for the slider handlers (built once)."""
+    __slots__ = ('pin', 'desc', 'min_val', 'max_val', 'step', 'baseline')
+
+    pin: str
+    desc: str
+    min_val: float
+    max_val: float
+    step: float
+    baseline: Optional[float]  # None when the parameter has no baseline value
+
+
+# =============================================================================
+# PLOT BLITTING
+# =============================================================================
+
+class BlitManager:
+    """
+    Blit helper for the live plot, after matplotlib's blitting tutorial.
+
+    Managed artists are marked animated, so full draws leave them out of the
+    captured background; the draw_event callback then paints them on top.
+    update() restores the background, draws only the managed artists and
+    blits the figure.
+    """
+
+    def __init__(self, canvas, artists=()):
+        self.canvas = canvas
+        self._bg = None
+        self._artists: list = []
+        self.set_artists(artists)
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    @property
+    def has_background(self) -> bool:
+        return self._bg is not None
+
+    def set_artists(self, artists):
+        """Replace the managed artists (e.g. after the axes are rebuilt)."""
+        self._artists = list(artists)
+        for artist in self._artists:
+            artist.set_animated(True)
+        self._bg = None
+
+    def invalidate(self):
+        """Drop the cached background; the next full draw recaptures it."""
+        self._bg = None
+
+    def _on_draw(self, event):
+        if event is None or self.canvas.is_saving():
+            return
+        self._bg = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._artists:
+            artist.axes.draw_artist(artist)  # No-op for hidden artists
+
+    def update(self):
+        """Redraw only the managed artists over the cached background."""
+        if self._bg is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+
 
 # =============================================================================
 # TOOLTIP CLASS
 # =============================================================================
 
 class Tooltip:
-    """Simple tooltip for widgets."""
-    
+    """
+    Simple tooltip for widgets, backed by one shared overlay window.
+
+    The text is stored on the widget as ``tooltip_text``. Tooltip widgets get
+    an extra ``Tooltip`` bindtag whose <Enter>/<Leave> handlers are bound
+    once per interpreter, so stock widget-class bindings are left alone, and
+    a single Toplevel is created on first hover and withdrawn/re-shown
+    afterwards.
+    """
+
+    BINDTAG = "Tooltip"
+
+    _window: Optional[tk.Toplevel] = None
+    _label: Optional[tk.Label] = None
+
     def __init__(self, widget, text: str):
         self.widget = widget
         self.text = text
-        self.tooltip_window = None
-        self.widget.bind("<Enter>", self._show)
-        self.widget.bind("<Leave>", self._hide)
-    
-    def _show(self, event=None):
-        """Show tooltip near widget."""
-        # Destroy any existing tooltip to prevent orphaned windows
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
-
-        x = self.widget.winfo_rootx() + 25
-        y = self.widget.winfo_rooty() + 25
-
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
-        
-        label = tk.Label(
-            self.tooltip_window,
-            text=self.text,
-            bg="lightyellow",
-            relief="solid",
-            bd=1,
-            padx=3,
-            pady=3,
-        )
-        label.pack()
-    
-    def _hide(self, event=None):
+        widget.tooltip_text = text
+
+        tags = widget.bindtags()
+        if Tooltip.BINDTAG not in tags:
+            widget.bindtags(tags + (Tooltip.BINDTAG,))
+        # Tag bindings live in the Tcl interpreter; an empty query means unbound
+        if not widget.bind_class(Tooltip.BINDTAG):
+            widget.bind_class(Tooltip.BINDTAG, "<Enter>", Tooltip._show)
+            widget.bind_class(Tooltip.BINDTAG, "<Leave>", Tooltip._hide)
+
+    @classmethod
+    def _get_window(cls, widget) -> tk.Toplevel:
+        """Return the shared tooltip window, creating it on first use."""
+        if cls._window is None or not cls._window.winfo_exists():
+            cls._window = tk.Toplevel(widget.winfo_toplevel())
+            cls._window.wm_overrideredirect(True)
+            cls._window.withdraw()
+            cls._label = tk.Label(
+                cls._window,
+                bg="lightyellow",
+                relief="solid",
+                bd=1,
+                padx=3,
+                pady=3,
+            )
+            cls._label.pack()
+        return cls._window
+
+    @classmethod
+    def _show(cls, event):
+        """Show tooltip near the hovered widget."""
+        widget = event.widget
+        text = getattr(widget, "tooltip_text", None)
+        if not text:
+            return
+
+        window = cls._get_window(widget)
+        x = widget.winfo_rootx() + 25
+        y = widget.winfo_rooty() + 25
+        cls._label.config(text=text)
+        window.wm_geometry(f"+{x}+{y}")
+        window.deiconify()
+        window.lift()
+
+    @classmethod
+    def _hide(cls, event=None):
         """Hide tooltip."""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if cls._window is not None and cls._window.winfo_exists():
+            cls._window.withdraw()
 
 
 # =============================================================================
@@ -156,27 +376,59 @@ class DashboardTab:
         self.param_vars: Dict[str, tk.DoubleVar] = {}
         self.param_labels: Dict[str, ttk.Label] = {}
         self.param_scales: Dict[str, ttk.Scale] = {}  # For lock/unlock control
+        self._specs: Dict[str, ParamSpec] = {
+            name: self._build_param_spec(name) for name in TUNING_PARAMS
+        }
+        self._lock_widget_ids: tuple = ()  # Tcl paths of scales + value labels
+        self._shown_params: Dict[str, float] = {}  # Value displayed per param label
         self.live_apply = tk.BooleanVar(value=True)
         self.params_locked = tk.BooleanVar(value=False)
+        # Mirrors of the parameter-panel toggles for slider/preset hot paths
+        self._py_ui: Dict[str, bool] = {}
+        self._mirror_var(self._py_ui, 'live_apply', self.live_apply)
+        self._mirror_var(self._py_ui, 'params_locked', self.params_locked)
 
         # Plot state
         self.show_traces: Dict[str, tk.BooleanVar] = {}
+        # Plain-Python mirrors of Tk variables, kept current by write traces so
+        # per-frame code reads a dict instead of making a Tcl round trip
+        self._py_show: Dict[str, bool] = {}
+        self._py_params: Dict[str, float] = {}
+        self._py_plot: Dict[str, Any] = {}
         self.figure = None
         self.ax = None
         self.ax2 = None  # Secondary y-axis for error
         self.canvas = None
         self.lines: Dict[str, "Line2D"] = {}  # String annotation for conditional import
+        # Visible traces as (name, line, axis) tuples, rebuilt on visibility/axis
+        # changes so the per-frame plot loop avoids dict lookups and Tcl reads
+        self._active_traces: List[tuple] = []
         self.plot_paused = False
         self.btn_pause = None
         self.time_scale = tk.IntVar(value=int(HISTORY_DURATION_S))
         self.dual_axis = tk.BooleanVar(value=False)
+        self._mirror_var(self._py_plot, 'time_scale', self.time_scale)
+        self._mirror_var(self._py_plot, 'dual_axis', self.dual_axis)
+        self.plot_decimation = tk.IntVar(value=PLOT_DECIMATION_SMOOTH)
+        self._mirror_var(self._py_plot, 'decimation', self.plot_decimation)
+        self._axes_dual: Optional[bool] = None  # Axis layout currently built
 
         # Blitting optimization state (for Raspberry Pi performance)
-        self.background = None  # Cached plot background for blitting
+        self._blit_mgr: Optional[BlitManager] = None  # Background + animated lines
         self.plot_dirty = False  # Flag to request full redraw
+        self._draw_pending = False  # An idle redraw is already queued
+        self._last_plot_seq: Optional[int] = None  # logger.sample_seq last plotted
+        # Plot-data export results (error text or None) from the writer thread
+        self._export_results: "queue.Queue[tuple]" = queue.Queue()
 
         # Text fallback for no-matplotlib systems
         self.text_fallback = None
+        self._text_fallback_lines: List[Optional[str]] = []  # Last rendered lines
+
+        # OpenCV fast plot (FAST_PLOT_MODE): Tk canvas + PhotoImage target
+        self.fast_plot = None
+        self._fast_plot_img = None
+        self._fast_plot_bg = None  # Cached RGB background with grid
 
         # Canvas-based fallback chart (when matplotlib unavailable)
         self.fallback_chart = None
@@ -192,14 +444,38 @@ class DashboardTab:
         self.bar_error_canvas = None
         self.bar_error_rect = None
 
-        # Statistics tracking
-        self.error_history: deque = deque(maxlen=int(STATS_WINDOW_S * 10))
+        # Statistics tracking: sliding-window running stats, O(1) per sample.
+        # error_history holds the window so evicted values can be backed out;
+        # mean/M2 follow Welford, min/max come from monotonic (seq, value) queues.
+        stats_len = max(2, int(STATS_WINDOW_S * UPDATE_HZ))
+        self.error_history: deque = deque(maxlen=stats_len)
+        self._err_seq = 0
+        self._err_mean = 0.0
+        self._err_m2 = 0.0
+        self._err_min_q: deque = deque()
+        self._err_max_q: deque = deque()
         self.stats_labels: Dict[str, ttk.Label] = {}
         self.session_peak_error = 0.0  # Persistent peak error (reset only manually)
 
+        # Tick counter for throttling slow readouts to SLOW_REFRESH_HZ
+        self._tick = 0
+        self._slow_every = max(1, round(UPDATE_HZ / SLOW_REFRESH_HZ))
+
         # Last known values for direction detection
         self.last_feedback = 0.0
         self.last_cmd = 0.0
+        # Last rendered direction key / VFD command, so unchanged ticks skip Tk
+        self._last_dir_key: Optional[int] = None
+        self._last_vfd_cmd: Optional[float] = None
+
+        # Last text/foreground written per readout label; update() skips the
+        # Tcl configure call when the formatted value has not changed
+        self._last_text: Dict[str, str] = {}
+        self._last_fg: Dict[str, str] = {}
+        self._last_value: Dict[str, float] = {}  # Raw values behind numeric readouts
+        self._last_status_state: Optional[tuple] = None
+        self._last_bar_pix: Optional[int] = None  # Error meter length (px)
+        self._last_bar_fill: Optional[str] = None
 
         # Status message for user feedback
         self.status_message = None
@@ -208,6 +484,19 @@ class DashboardTab:
         self._setup_ui()
         self._setup_keyboard_shortcuts()
 
+    @staticmethod
+    def _mirror_var(store: Dict[str, Any], key: str, var: tk.Variable):
+        """Keep ``store[key]`` equal to ``var``'s value via a write trace."""
+        store[key] = var.get()
+        var.trace_add('write', lambda *_: store.__setitem__(key, var.get()))
+
+    def _add_trace_var(self, name: str, visible: bool) -> tk.BooleanVar:
+        """Create a mirrored visibility variable for plot trace ``name``."""
+        var = tk.BooleanVar(value=visible)
+        self.show_traces[name] = var
+        self._mirror_var(self._py_show, name, var)
+        return var
+
     @staticmethod
     def _coerce_float(value: Any, default: float = 0.0) -> float:
         """Safely convert a value to float for numeric widgets."""
@@ -234,6 +523,19 @@ class DashboardTab:
         for i, val in enumerate(seq[:len(filled)]):
             filled[i] = val
         return tuple(filled)
+
+    @classmethod
+    def _build_param_spec(cls, param_name: str) -> ParamSpec:
+        """Resolve TUNING_PARAMS/BASELINE_PARAMS entries into a ParamSpec."""
+        pin, desc, min_val, max_val, step, _, _ = cls._get_param_meta(param_name)
+        return ParamSpec(pin, desc, min_val, max_val, step, BASELINE_PARAMS.get(param_name))
+
+    def _get_spec(self, param_name: str) -> ParamSpec:
+        """Return the cached ParamSpec, resolving unknown names on demand."""
+        spec = self._specs.get(param_name)
+        if spec is None:
+            spec = self._specs[param_name] = self._build_param_spec(param_name)
+        return spec
     
     # =========================================================================
     # UI SETUP
@@ -399,7 +701,33 @@ class DashboardTab:
             color = "green" if not warn else "orange"
         else:
             color = "red"
-        lbl.config(foreground=color)
+        self._set_fg(f"status.{key}", lbl, color)
+
+    def _set_text(self, key: str, lbl, text: str, foreground: Optional[str] = None):
+        """Configure ``lbl`` only with the options that changed since last write."""
+        changes = {}
+        if self._last_text.get(key) != text:
+            self._last_text[key] = text
+            changes['text'] = text
+        if foreground is not None and self._last_fg.get(key) != foreground:
+            self._last_fg[key] = foreground
+            changes['foreground'] = foreground
+        if changes:
+            lbl.config(**changes)
+
+    def _set_number(self, key: str, lbl, value: float, spec: str,
+                    foreground: Optional[str] = None):
+        """Format ``value`` with ``spec`` into ``lbl``, skipping the format when unchanged."""
+        if self._last_value.get(key) == value:
+            return
+        self._last_value[key] = value
+        self._set_text(key, lbl, format(value, spec), foreground)
+
+    def _set_fg(self, key: str, lbl, foreground: str):
+        """Set ``lbl``'s foreground unless it already has that color."""
+        if self._last_fg.get(key) != foreground:
+            self._last_fg[key] = foreground
+            lbl.config(foreground=foreground)
     
     def _setup_statistics(self, parent: ttk.Frame):
         """Setup statistics panel showing min/max/avg."""
@@ -477,6 +805,10 @@ class DashboardTab:
         plot_frame = ttk.LabelFrame(parent, text="Real-Time Plot", padding="5")
         plot_frame.pack(fill=tk.BOTH, expand=True)
 
+        if FAST_PLOT_MODE and HAS_CV2:
+            self._setup_fast_plot(plot_frame)
+            return
+
         if not HAS_MATPLOTLIB:
             ttk.Label(
                 plot_frame,
@@ -494,6 +826,12 @@ class DashboardTab:
                 borderwidth=8
             )
             self.text_fallback.pack(fill=tk.BOTH, expand=True)
+
+            # Pre-create one line per template row so updates can replace in place
+            self.text_fallback.config(state=tk.NORMAL)
+            self.text_fallback.insert('1.0', "\n" * len(TEXT_FALLBACK_TEMPLATE))
+            self.text_fallback.config(state=tk.DISABLED)
+            self._text_fallback_lines = [None] * len(TEXT_FALLBACK_TEMPLATE)
             return
         
         # Plot controls bar
@@ -515,13 +853,19 @@ class DashboardTab:
         
         # Dual axis toggle
         ttk.Checkbutton(controls, text="Dual Y-axis", variable=self.dual_axis,
-                       command=self._setup_plot_axes).pack(side=tk.LEFT, padx=10)
+                       command=self._on_dual_axis_toggle).pack(side=tk.LEFT, padx=10)
         
         # Grid toggle
         self.plot_grid = tk.BooleanVar(value=True)
+        self._mirror_var(self._py_plot, 'grid', self.plot_grid)
         ttk.Checkbutton(controls, text="Grid", variable=self.plot_grid,
                        command=self._toggle_plot_grid).pack(side=tk.LEFT, padx=5)
 
+        # Plot refresh rate: smooth (every tick) or low-CPU (decimated)
+        ttk.Checkbutton(controls, text="Low CPU", variable=self.plot_decimation,
+                        onvalue=PLOT_DECIMATION_LOW_CPU,
+                        offvalue=PLOT_DECIMATION_SMOOTH).pack(side=tk.LEFT, padx=5)
+
         self.plot_mode_label = ttk.Label(
             controls, text="Plot: Command, Feedback, Error, Integrator", foreground="gray40"
         )
@@ -530,7 +874,7 @@ class DashboardTab:
         # Initialize trace visibility variables before building axes so defaults apply
         for name, config in PLOT_TRACES.items():
             if name not in self.show_traces:
-                self.show_traces[name] = tk.BooleanVar(value=PLOT_DEFAULTS.get(name, True))
+                self._add_trace_var(name, PLOT_DEFAULTS.get(name, True))
 
         # Fit button (manual auto-scale without clearing data)
         ttk.Button(controls, text="Fit", width=4,
@@ -549,17 +893,17 @@ class DashboardTab:
                   command=self._clear_plot).pack(side=tk.RIGHT, padx=2)
         
         # Create figure with tight layout for better use of space
+        matplotlib.rcParams.update(PLOT_RC_PARAMS)
         self.figure = Figure(figsize=(8, 4), dpi=100)
         self.figure.set_tight_layout(True)
         self._setup_plot_axes()
         
-        # Embed in Tk
+        # Embed in Tk; the blit manager captures the background on each draw
         self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
+        self._blit_mgr = BlitManager(self.canvas, self.lines.values())
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
-        # Connect events for blitting optimization
-        self.canvas.mpl_connect('draw_event', self._on_plot_draw)
         self.canvas.mpl_connect('resize_event', lambda e: setattr(self, 'plot_dirty', True))
         
         # Toolbar
@@ -581,13 +925,110 @@ class DashboardTab:
         # Initialize dynamic label to match default visible traces
         self._update_plot_mode_label()
     
+    def _setup_fast_plot(self, plot_frame: ttk.Frame):
+        """
+        Setup the OpenCV-rendered plot (FAST_PLOT_MODE).
+
+        Traces are drawn with cv2.polylines into an RGB buffer and pushed to a
+        Tk PhotoImage as PPM data, bypassing matplotlib/Agg entirely.
+        """
+        controls = ttk.Frame(plot_frame)
+        controls.pack(fill=tk.X, pady=(0, 5))
+
+        self.btn_pause = ttk.Button(controls, text="⏸ Pause", width=10,
+                                    command=self._toggle_plot_pause)
+        self.btn_pause.pack(side=tk.LEFT, padx=2)
+
+        ttk.Label(controls, text="Time:").pack(side=tk.LEFT, padx=(10, 2))
+        for scale in TIME_SCALE_OPTIONS:
+            ttk.Radiobutton(controls, text=f"{scale}s", value=scale,
+                            variable=self.time_scale).pack(side=tk.LEFT, padx=2)
+
+        ttk.Checkbutton(controls, text="Low CPU", variable=self.plot_decimation,
+                        onvalue=PLOT_DECIMATION_LOW_CPU,
+                        offvalue=PLOT_DECIMATION_SMOOTH).pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(controls, text="Fast plot (OpenCV)",
+                  foreground="gray40").pack(side=tk.LEFT, padx=10)
+
+        width, height = FAST_PLOT_SIZE
+        self.fast_plot = tk.Canvas(plot_frame, width=width, height=height,
+                                   bg="white", highlightthickness=0)
+        self.fast_plot.pack(fill=tk.BOTH, expand=True)
+        self._fast_plot_img = tk.PhotoImage(width=width, height=height)
+        self.fast_plot.create_image(0, 0, image=self._fast_plot_img, anchor="nw")
+
+        # White background with a 5x5 light grid, drawn once and copied per frame
+        bg = np.full((height, width, 3), 255, dtype=np.uint8)
+        for i in range(1, 5):
+            bg[i * height // 5, :] = 220
+            bg[:, i * width // 5] = 220
+        self._fast_plot_bg = bg
+
+        trace_frame = ttk.Frame(plot_frame)
+        trace_frame.pack(fill=tk.X)
+        ttk.Label(trace_frame, text="Show:", font=("Arial", 9)).pack(side=tk.LEFT)
+        for name, config in PLOT_TRACES.items():
+            var = self.show_traces.get(name) or self._add_trace_var(
+                name, PLOT_DEFAULTS.get(name, True)
+            )
+            ttk.Checkbutton(trace_frame, text=config.get('label', name),
+                            variable=var).pack(side=tk.LEFT, padx=5)
+
+    def _render_plot_cv2(self):
+        """Render visible traces with OpenCV and blit them into the PhotoImage."""
+        if self._fast_plot_img is None:
+            return
+
+        times, trace_data = self._read_plot_data()
+        if not len(times):
+            return
+
+        height, width = self._fast_plot_bg.shape[:2]
+        t = np.asarray(times, dtype=np.float64)
+        scale = self._py_plot['time_scale']
+        t_max = max(t[-1], scale)
+        t_min = t_max - scale
+        start = int(np.searchsorted(t, t_min))
+        t = t[start:]
+        if t.size < 2:
+            return
+
+        visible = []
+        for name, config in PLOT_TRACES.items():
+            if not self._py_show.get(name, True):
+                continue
+            series = np.asarray(trace_data.get(name, ())[start:], dtype=np.float64)
+            if series.size == t.size:
+                visible.append((series, FAST_PLOT_COLORS.get(config.get('color'), (0, 0, 0))))
+
+        img = self._fast_plot_bg.copy()
+        if visible:
+            data = np.concatenate([series for series, _ in visible])
+            y_min = data.min() - 50
+            y_max = data.max() + 50
+            xs = ((t - t_min) * ((width - 1) / scale)).astype(np.int32)
+            y_scale = (height - 1) / (y_max - y_min)
+            for series, color in visible:
+                ys = ((y_max - series) * y_scale).astype(np.int32)
+                pts = np.column_stack((xs, ys)).reshape(-1, 1, 2)
+                cv2.polylines(img, [pts], False, color, 1, cv2.LINE_8)
+
+        header = f"P6 {width} {height} 255 ".encode("ascii")
+        self._fast_plot_img.configure(data=header + img.tobytes(), format="PPM")
+
     def _setup_plot_axes(self):
-        """Setup or reconfigure plot axes."""
+        """
+        Build the plot axes and lines from scratch.
+
+        Only needed for the initial layout and when the dual-axis mode flips;
+        time-scale changes are applied in place by _apply_time_scale().
+        """
         if self.figure is None:
             return
 
+        self._axes_dual = self.dual_axis.get()
         self.figure.clear()
-        self.background = None  # Reset blitting background
         self.plot_dirty = True  # Request full redraw
         
         self.ax = self.figure.add_subplot(111)
@@ -596,14 +1037,13 @@ class DashboardTab:
         self.ax.set_xlim(0, self.time_scale.get())
         self.ax.set_ylim(-100, 2000)  # Initial range
         # Respect current grid toggle state when rebuilding axes
-        grid_enabled = True if not hasattr(self, "plot_grid") else self.plot_grid.get()
+        grid_enabled = self._py_plot.get('grid', True)
         self.ax.grid(grid_enabled, alpha=0.3)
 
         # Create lines with animated=True for blitting optimization
         self.lines = {}
-        animated = not self.dual_axis.get()
 
-        if self.dual_axis.get():
+        if self._axes_dual:
             # Dual axis mode: RPM on left, error on right
             self.ax2 = self.ax.twinx()
             self.ax2.set_ylabel("Error (RPM)", color='red')
@@ -616,8 +1056,8 @@ class DashboardTab:
                     color = config.get('color', 'black')
                     label = config.get('label', name)
                     line, = self.ax.plot([], [], color=color,
-                                        label=label, linewidth=1.5,
-                                        animated=animated)
+                                        label=label, animated=True,
+                                        **PLOT_LINE_STYLE)
                     self.lines[name] = line
 
             # Error traces on secondary axis
@@ -627,8 +1067,8 @@ class DashboardTab:
                     color = config.get('color', 'black')
                     label = config.get('label', name)
                     line, = self.ax2.plot([], [], color=color,
-                                         label=label, linewidth=1.5,
-                                         linestyle='--', animated=animated)
+                                         label=label, linestyle='--',
+                                         animated=True, **PLOT_LINE_STYLE)
                     self.lines[name] = line
         else:
             # Single axis mode
@@ -637,8 +1077,8 @@ class DashboardTab:
                 color = config.get('color', 'black')
                 label = config.get('label', name)
                 line, = self.ax.plot([], [], color=color,
-                                    label=label, linewidth=1.5,
-                                    animated=animated)
+                                    label=label, animated=True,
+                                    **PLOT_LINE_STYLE)
                 self.lines[name] = line
 
         # Apply existing trace visibility preferences (e.g., after toggling dual axis)
@@ -648,7 +1088,7 @@ class DashboardTab:
                 line.set_visible(visible_var.get())
 
         # Build legend using only visible traces to reflect defaults immediately
-        if self.dual_axis.get():
+        if self._axes_dual:
             lines1 = [l for l in self.ax.get_lines() if l.get_visible()]
             labels1 = [l.get_label() for l in lines1]
             if self.ax2:
@@ -664,15 +1104,44 @@ class DashboardTab:
                                [line.get_label() for line in visible_lines],
                                loc='upper right', fontsize=8, framealpha=0.5)
 
+        self._rebuild_active_traces()
+        if self._blit_mgr is not None:
+            self._blit_mgr.set_artists(self.lines.values())
 
         if self.canvas:
             self.canvas.draw()
 
+    def _rebuild_active_traces(self):
+        """Cache the visible traces (name, line, axis) in PLOT_TRACES order."""
+        active = []
+        for name in PLOT_TRACES:
+            line = self.lines.get(name)
+            if line is None:
+                continue
+            if not self._py_show.get(name, True):
+                continue
+            if self.ax2 is not None and name in ('error', 'errorI'):
+                active.append((name, line, self.ax2))
+            else:
+                active.append((name, line, self.ax))
+        self._active_traces = active
+
+    def _request_draw(self):
+        """Queue one idle canvas redraw; repeated requests before it runs coalesce."""
+        if self.canvas is None or self._draw_pending:
+            return
+        self._draw_pending = True
+        self.parent.after_idle(self._do_draw)
+
+    def _do_draw(self):
+        self._draw_pending = False
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+
     def _fit_plot(self):
         """Request a plot rescale and trigger a redraw."""
         self.plot_dirty = True
-        if self.canvas:
-            self.canvas.draw_idle()
+        self._request_draw()
 
     def _setup_canvas_fallback(self, parent: ttk.Frame):
         """
@@ -896,15 +1365,7 @@ class DashboardTab:
             self.fallback_labels['feedback'].config(text=f"{feedback:.0f}")
 
             # Color-code error based on magnitude
-            abs_err = abs(error)
-            if abs_err < ERROR_THRESHOLD_EXCELLENT:
-                err_color = "green"
-            elif abs_err < ERROR_THRESHOLD_GOOD:
-                err_color = "blue"
-            elif abs_err < ERROR_THRESHOLD_WARNING:
-                err_color = "orange"
-            else:
-                err_color = "red"
+            err_color = ERROR_LABEL_COLORS[bisect_right(ERROR_BANDS, abs(error))]
 
             self.fallback_labels['error'].config(text=f"{error:.1f}", foreground=err_color)
             self.fallback_labels['errorI'].config(text=f"{errorI:.1f}")
@@ -922,24 +1383,28 @@ class DashboardTab:
         out = values.get('output', 0)
         revs = values.get('spindle_revs', 0)
 
-        self.text_fallback.config(state=tk.NORMAL)
-        self.text_fallback.delete('1.0', tk.END)
-
-        text = (
-            f"Time: {time.strftime('%H:%M:%S')}\n"
-            f"Cmd:       {cmd:8.0f} RPM\n"
-            f"Feedback:  {fb:8.0f} RPM\n"
-            f"Error:     {err:8.1f} RPM\n"
-            f"Integrator: {errI:8.1f}\n"
-            f"PID Out:   {out:8.1f}\n"
-            f"Revs:      {revs:8.2f}\n"
-        )
+        fields = {
+            'time': time.strftime('%H:%M:%S'),
+            'cmd': cmd, 'fb': fb, 'err': err, 'errI': errI, 'out': out, 'revs': revs,
+        }
 
-        self.text_fallback.insert(tk.END, text)
-        self.text_fallback.config(state=tk.DISABLED)
+        # Only rewrite the lines whose rendered text changed
+        last = self._text_fallback_lines
+        changed = []
+        for i, template in enumerate(TEXT_FALLBACK_TEMPLATE):
+            line = template.format_map(fields)
+            if line != last[i]:
+                last[i] = line
+                changed.append((i + 1, line))
+
+        if changed:
+            self.text_fallback.config(state=tk.NORMAL)
+            for row, line in changed:
+                self.text_fallback.replace(f"{row}.0", f"{row}.end", line)
+            self.text_fallback.config(state=tk.DISABLED)
 
         # Update RPM bar visualization
-        if hasattr(self, 'fallback_bar_canvas'):
+        if self.fallback_bar_canvas is not None:
             self._update_fallback_bars(cmd, fb)
 
         # Add data point to chart history
@@ -1006,14 +1471,12 @@ class DashboardTab:
         now = time.time()
         time_window = 30.0
 
-        traces = {
-            'cmd': ('blue', self.fallback_traces.get('cmd', tk.BooleanVar(value=True))),
-            'feedback': ('green', self.fallback_traces.get('feedback', tk.BooleanVar(value=True))),
-            'error': ('red', self.fallback_traces.get('error', tk.BooleanVar(value=True))),
-        }
+        traces = (('cmd', 'blue'), ('feedback', 'green'), ('error', 'red'))
 
-        for trace_name, (color, visible_var) in traces.items():
-            if not visible_var.get():
+        for trace_name, color in traces:
+            # Missing toggle means visible; don't allocate a Tcl var per frame
+            visible_var = self.fallback_traces.get(trace_name)
+            if visible_var is not None and not visible_var.get():
                 continue
 
             points = []
@@ -1092,7 +1555,8 @@ class DashboardTab:
                 if param_name not in TUNING_PARAMS:
                     continue
 
-                pin, desc, min_val, max_val, step, _, _ = self._get_param_meta(param_name)
+                spec = self._get_spec(param_name)
+                desc, min_val, max_val = spec.desc, spec.min_val, spec.max_val
                 
                 frame = ttk.Frame(group_frame)
                 frame.pack(fill=tk.X, pady=2)
@@ -1101,18 +1565,21 @@ class DashboardTab:
                 lbl = ttk.Label(frame, text=param_name, width=9)
                 lbl.pack(side=tk.LEFT)
                 Tooltip(lbl, f"{desc}\nRange: {min_val} - {max_val}\nRight-click to reset")
-                lbl.bind("<Button-3>", lambda e, p=param_name: self._show_param_context_menu(e, p))
+                lbl.param_name = param_name
+                lbl.bind("<Button-3>", self._on_param_context_event)
                 
                 # Variable
-                var = tk.DoubleVar(value=BASELINE_PARAMS.get(param_name, 0))
+                var = tk.DoubleVar(value=spec.baseline if spec.baseline is not None else 0)
                 self.param_vars[param_name] = var
+                self._mirror_var(self._py_params, param_name, var)
                 
                 # Scale with right-click context menu
                 scale = ttk.Scale(frame, from_=min_val, to=max_val, variable=var,
                                  orient=tk.HORIZONTAL, length=90,
-                                 command=lambda v, p=param_name: self._on_slider_change(p, v))
+                                 command=partial(self._on_slider_change, param_name))
                 scale.pack(side=tk.LEFT, padx=2)
-                scale.bind("<Button-3>", lambda e, p=param_name: self._show_param_context_menu(e, p))
+                scale.param_name = param_name
+                scale.bind("<Button-3>", self._on_param_context_event)
                 self.param_scales[param_name] = scale  # Store for lock control
                 
                 # Value label - clickable for precision editing
@@ -1120,13 +1587,20 @@ class DashboardTab:
                                     font=("Courier", 9, "underline"),
                                     foreground="blue", cursor="hand2")
                 val_lbl.pack(side=tk.LEFT)
-                val_lbl.bind("<Button-1>", lambda e, p=param_name: self._edit_param_value(p))
-                val_lbl.bind("<Button-3>", lambda e, p=param_name: self._show_param_context_menu(e, p))
+                val_lbl.param_name = param_name
+                val_lbl.bind("<Button-1>", self._on_param_value_click)
+                val_lbl.bind("<Button-3>", self._on_param_context_event)
                 self.param_labels[param_name] = val_lbl
+                self._shown_params[param_name] = var.get()
                 self._update_param_label_style(param_name)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Tcl path names of lockable widgets, so lock toggles are one eval
+        self._lock_widget_ids = tuple(
+            str(w) for w in (*self.param_scales.values(), *self.param_labels.values())
+        )
         
         # Apply button at bottom (disabled when live_apply is on)
         self.apply_all_btn = ttk.Button(param_frame, text="Apply All to HAL",
@@ -1137,16 +1611,32 @@ class DashboardTab:
         self.live_apply.trace_add("write", self._update_apply_button_state)
         self._update_apply_button_state()  # Set initial state
 
+    # Shared event handlers for parameter widgets; the parameter is read from
+    # the widget's ``param_name`` attribute set in _setup_parameters.
+
+    def _on_param_context_event(self, event):
+        self._show_param_context_menu(event, event.widget.param_name)
+
+    def _on_param_value_click(self, event):
+        self._edit_param_value(event.widget.param_name)
+
+    def _show_param_value(self, param_name: str, value: float):
+        """Display ``value`` on the parameter's value label and restyle it."""
+        self._shown_params[param_name] = value
+        lbl = self.param_labels.get(param_name)
+        if lbl is not None:
+            lbl.config(text=f"{value:.2f}")
+            self._update_param_label_style(param_name)
+
     def _update_param_label_style(self, param_name: str):
-        baseline = BASELINE_PARAMS.get(param_name)
+        baseline = self._get_spec(param_name).baseline
         if baseline is None:
             return
-        current = self.param_vars.get(param_name)
+        value = self._py_params.get(param_name)
         lbl = self.param_labels.get(param_name)
-        if not current or not lbl:
+        if value is None or not lbl:
             return
 
-        value = current.get()
         if abs(value - baseline) < 1e-6:
             lbl.config(foreground="gray25", font=("Courier", 9, "underline"))
         else:
@@ -1182,10 +1672,11 @@ class DashboardTab:
     
     def _edit_param_value(self, param_name: str):
         """Open dialog to edit parameter value with precision."""
-        if self.params_locked.get():
+        if self._py_ui['params_locked']:
             return
         current_val = self.param_vars[param_name].get()
-        _, desc, min_val, max_val, _, _, _ = self._get_param_meta(param_name)
+        spec = self._get_spec(param_name)
+        desc, min_val, max_val = spec.desc, spec.min_val, spec.max_val
         
         new_val = simpledialog.askfloat(
             "Set Parameter", 
@@ -1202,13 +1693,13 @@ class DashboardTab:
 
             # Update UI and HAL
             self.param_vars[param_name].set(new_val)
-            self._on_slider_change(param_name, str(new_val))
+            self._on_slider_change(param_name, str(new_val), force=True)
             self._update_param_label_style(param_name)
     
     def _show_param_context_menu(self, event, param_name: str):
         """Show context menu for parameter with reset option."""
         menu = tk.Menu(self.parent, tearoff=0)
-        baseline = BASELINE_PARAMS.get(param_name, 0.0)
+        baseline = self._get_spec(param_name).baseline or 0.0
         current = self.param_vars[param_name].get()
         
         menu.add_command(
@@ -1227,9 +1718,9 @@ class DashboardTab:
     
     def _reset_single_param(self, param_name: str):
         """Reset a single parameter to its baseline value."""
-        baseline = BASELINE_PARAMS.get(param_name, 0.0)
+        baseline = self._get_spec(param_name).baseline or 0.0
         self.param_vars[param_name].set(baseline)
-        self._on_slider_change(param_name, str(baseline))
+        self._on_slider_change(param_name, str(baseline), force=True)
         self._show_status_message(f"Reset {param_name} to baseline ({baseline:.2f})")
     
     def _update_apply_button_state(self, *args):
@@ -1243,13 +1734,13 @@ class DashboardTab:
     def _toggle_params_lock(self):
         """Toggle parameter lock state to prevent accidental changes."""
         locked = self.params_locked.get()
-        new_state = tk.DISABLED if locked else tk.NORMAL
 
-        for scale in self.param_scales.values():
-            scale.configure(state=new_state)
-
-        for lbl in self.param_labels.values():
-            lbl.configure(state=new_state)
+        # Single Tcl script for all sliders/labels instead of one call per widget
+        state_spec = "disabled" if locked else "!disabled"
+        if self._lock_widget_ids:
+            self.parent.tk.eval(
+                "\n".join(f"{wid} state {state_spec}" for wid in self._lock_widget_ids)
+            )
 
         if hasattr(self, 'lock_btn'):
             self.lock_btn.config(text="🔒" if locked else "🔓")
@@ -1334,22 +1825,38 @@ class DashboardTab:
     
     def _on_time_scale_change(self):
         """Handle time scale change."""
-        if self.ax:
-            scale = self.time_scale.get()
-            self.ax.set_xlim(0, scale)
-            self.plot_dirty = True
-            if self.canvas:
-                self.canvas.draw_idle()
+        self._apply_time_scale()
+
+    def _apply_time_scale(self):
+        """Update the x-window in place; lines and axes are kept."""
+        if not self.ax:
+            return
+        scale = self.time_scale.get()
+        x_max = scale
+        if self._active_traces:
+            times = self._active_traces[0][1].get_xdata()
+            if len(times):
+                x_max = max(times[-1], scale)
+        self.ax.set_xlim(max(0, x_max - scale), x_max)
+        self.plot_dirty = True
+        # The next live frame does the full redraw; only draw now when paused
+        if self.plot_paused:
+            self._request_draw()
+
+    def _on_dual_axis_toggle(self):
+        """Rebuild the axes only when the dual-axis mode actually changed."""
+        if self.dual_axis.get() != self._axes_dual:
+            self._setup_plot_axes()
     
     def _clear_plot(self):
         """Clear plot data and reset blitting."""
         self.logger.clear_buffers()
         for line in self.lines.values():
             line.set_data([], [])
-        self.background = None  # Reset blitting background
+        if self._blit_mgr is not None:
+            self._blit_mgr.invalidate()
         self.plot_dirty = True
-        if self.canvas:
-            self.canvas.draw_idle()
+        self._request_draw()
     
     def _save_plot(self):
         """Save plot as image."""
@@ -1375,8 +1882,7 @@ class DashboardTab:
         if self.ax:
             self.ax.grid(self.plot_grid.get(), alpha=0.3)
             self.plot_dirty = True
-            if self.canvas:
-                self.canvas.draw_idle()
+            self._request_draw()
     
     def _export_plot_data(self):
         """Export current plot data to CSV file."""
@@ -1384,30 +1890,26 @@ class DashboardTab:
             messagebox.showinfo("No Data", "No plot data to export.")
             return
         
-        # Get times from any line
+        # Get times from any visible line (hidden lines are not kept current)
         times = None
-        for line in self.lines.values():
+        for _, line, _ in self._active_traces:
             xdata = line.get_xdata()
             if len(xdata) > 0:
-                times = list(xdata)
+                times = xdata
                 break
         
-        if not times:
+        if times is None:
             messagebox.showinfo("No Data", "No plot data to export.")
             return
         
-        # Build headers and data columns
+        # Build headers and data columns from the visible traces. Line data is
+        # passed through as-is (ndarrays); zip_longest pads short columns.
         headers = ["Time (s)"]
         columns = [times]
         
-        for name, line in self.lines.items():
-            if line.get_visible():
-                headers.append(PLOT_TRACES.get(name, {}).get('label', name))
-                ydata = list(line.get_ydata())
-                # Pad with empty if different length
-                while len(ydata) < len(times):
-                    ydata.append("")
-                columns.append(ydata)
+        for name, line, _ in self._active_traces:
+            headers.append(PLOT_TRACES.get(name, {}).get('label', name))
+            columns.append(line.get_ydata())
         
         # Prompt for save location
         filepath = filedialog.asksaveasfilename(
@@ -1417,39 +1919,66 @@ class DashboardTab:
         )
         
         if filepath:
-            try:
-                with open(filepath, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(headers)
-                    # Transpose columns to rows
-                    for i in range(len(times)):
-                        row = [col[i] if i < len(col) else "" for col in columns]
-                        writer.writerow(row)
-                self._show_status_message(f"Data exported to {filepath}")
-            except Exception as e:
-                messagebox.showerror("Export Failed", f"Could not export data:\n{e}")
+            # Snapshot the columns (matplotlib implies NumPy) and write on a
+            # background thread so a long history doesn't freeze the UI
+            columns = [np.array(col) for col in columns]
+            threading.Thread(
+                target=self._write_plot_csv, args=(filepath, headers, columns),
+                name="plot-csv-export", daemon=True,
+            ).start()
+            self._show_status_message("Exporting plot data...")
+            self.parent.after(CSV_EXPORT_POLL_MS, self._poll_plot_export)
+
+    def _write_plot_csv(self, filepath: str, headers: List[str], columns: list):
+        """Worker thread: write the export CSV and queue the result for the Tk thread."""
+        error = None
+        try:
+            with open(filepath, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f, dialect='excel')
+                writer.writerow(headers)
+                # Transpose columns to rows lazily, written in batches
+                rows = zip_longest(*columns, fillvalue="")
+                while True:
+                    batch = list(islice(rows, CSV_EXPORT_BATCH_ROWS))
+                    if not batch:
+                        break
+                    writer.writerows(batch)
+        except Exception as e:
+            error = str(e)
+        self._export_results.put((filepath, error))
+
+    def _poll_plot_export(self):
+        """Report a finished plot-data export (Tk thread); re-poll until one arrives."""
+        try:
+            filepath, error = self._export_results.get_nowait()
+        except queue.Empty:
+            self.parent.after(CSV_EXPORT_POLL_MS, self._poll_plot_export)
+            return
+        if error is not None:
+            messagebox.showerror("Export Failed", f"Could not export data:\n{error}")
+        else:
+            self._show_status_message(f"Data exported to {filepath}")
     
     def _update_trace_visibility(self):
         """Update which traces are visible on plot."""
         for name, line in self.lines.items():
             if name not in self.show_traces:
                 # Ensure dynamically created traces have a visibility variable
-                self.show_traces[name] = tk.BooleanVar(value=True)
+                self._add_trace_var(name, True)
 
-            visible = self.show_traces[name].get()
-            line.set_visible(visible)
+            line.set_visible(self._py_show[name])
+        self._rebuild_active_traces()
         # Update the plot mode label to reflect visible traces
         self._update_plot_mode_label()
         # Full redraw needed to update legend/autoscale
         self.plot_dirty = True
-        if self.canvas:
-            self.canvas.draw_idle()
+        self._request_draw()
 
     def _update_plot_mode_label(self):
         """Update plot mode label to show only visible trace names."""
         visible_labels = []
         for name, config in PLOT_TRACES.items():
-            if name in self.show_traces and self.show_traces[name].get():
+            if self._py_show.get(name):
                 visible_labels.append(config.get('label', name))
         if visible_labels:
             label_text = f"Plot: {', '.join(visible_labels)}"
@@ -1458,18 +1987,14 @@ class DashboardTab:
         if hasattr(self, 'plot_mode_label') and self.plot_mode_label:
             self.plot_mode_label.config(text=label_text)
     
-    def _on_plot_draw(self, event):
-        """Callback to capture static background for blitting optimization."""
-        if event is not None and self.ax is not None:
-            self.background = self.canvas.copy_from_bbox(self.ax.bbox)
-    
     # =========================================================================
     # PARAMETER CONTROLS
     # =========================================================================
     
     def _snap_param(self, param_name: str, value: float) -> float:
         """Snap parameter value to configured step (matches HAL's _clamp_and_snap)."""
-        _, _, min_val, max_val, step, _, _ = self._get_param_meta(param_name)
+        spec = self._get_spec(param_name)
+        min_val, max_val, step = spec.min_val, spec.max_val, spec.step
         v = max(min_val, min(max_val, value))
         if step and step > 0:
             steps = round((v - min_val) / step)
@@ -1477,19 +2002,26 @@ class DashboardTab:
             v = max(min_val, min(max_val, v))
         return v
 
-    def _on_slider_change(self, param_name: str, value: str):
-        """Handle slider change."""
-        if self.params_locked.get():
+    def _on_slider_change(self, param_name: str, value: str, force: bool = False):
+        """
+        Handle slider change.
+
+        A drag within the same step skips the label and HAL writes; explicit
+        edits and resets pass ``force`` so an unchanged value still reaches
+        HAL, which may have drifted from the displayed value.
+        """
+        if self._py_ui['params_locked']:
             return
         try:
             val = self._snap_param(param_name, float(value))
             self.param_vars[param_name].set(val)
-            if param_name in self.param_labels:
-                self.param_labels[param_name].config(text=f"{val:.2f}")
-                self._update_param_label_style(param_name)
+            if val != self._shown_params.get(param_name):
+                self._show_param_value(param_name, val)
+            elif not force:
+                return
             
             # Live apply if enabled (dashboard has direct HAL access)
-            if self.live_apply.get():
+            if self._py_ui['live_apply']:
                 self.hal.set_param(param_name, val)
             
             # Notify callback only when NOT live applying (avoids double writes)
@@ -1503,21 +2035,20 @@ class DashboardTab:
         for param_name in self.param_vars:
             value = self._coerce_float(self.hal.get_param(param_name))
             self.param_vars[param_name].set(value)
-            if param_name in self.param_labels:
-                self.param_labels[param_name].config(text=f"{value:.2f}")
-                self._update_param_label_style(param_name)
+            self._show_param_value(param_name, value)
         self._show_status_message("Parameters loaded from HAL")
     
     def reset_to_baseline(self):
         """Reset all parameters to baseline values."""
+        pending = {}
         for param_name, value in BASELINE_PARAMS.items():
             if param_name in self.param_vars:
                 self.param_vars[param_name].set(value)
-                if param_name in self.param_labels:
-                    self.param_labels[param_name].config(text=f"{value:.2f}")
-                    self._update_param_label_style(param_name)
-                if self.live_apply.get():
-                    self.hal.set_param(param_name, value)
+                self._show_param_value(param_name, value)
+                pending[param_name] = value
+        # One halcmd batch instead of a subprocess per parameter
+        if pending and self._py_ui['live_apply']:
+            self.hal.set_params_bulk(pending)
         self._show_status_message("Reset all parameters to baseline")
     
     def apply_preset(self, preset_name: str):
@@ -1526,35 +2057,36 @@ class DashboardTab:
             return
         
         preset = PRESETS[preset_name]
+        live = self._py_ui['live_apply']
+        pending = {}
         for param, value in preset.items():
             if param in self.param_vars:
                 self.param_vars[param].set(value)
-                if param in self.param_labels:
-                    self.param_labels[param].config(text=f"{value:.2f}")
-                    self._update_param_label_style(param)
-                if self.live_apply.get():
-                    self.hal.set_param(param, value)
+                self._show_param_value(param, value)
+                if live:
+                    pending[param] = value
                 elif self.on_param_change:
                     self.on_param_change(param, value)
+        # One halcmd batch instead of a subprocess per parameter
+        if pending:
+            self.hal.set_params_bulk(pending)
         self._show_status_message(f"Applied '{preset_name}' preset")
     
     def apply_all_params(self):
         """Apply all current parameter values to HAL."""
-        for param, var in self.param_vars.items():
-            self.hal.set_param(param, var.get())
+        if self._py_params:
+            self.hal.set_params_bulk(dict(self._py_params))
     
     def get_param_values(self) -> Dict[str, float]:
         """Get current parameter values."""
-        return {param: var.get() for param, var in self.param_vars.items()}
+        return dict(self._py_params)
     
     def set_param_values(self, params: Dict[str, float]):
         """Set parameter values from dict."""
         for param, value in params.items():
             if param in self.param_vars:
                 self.param_vars[param].set(value)
-                if param in self.param_labels:
-                    self.param_labels[param].config(text=f"{value:.2f}")
-                    self._update_param_label_style(param)
+                self._show_param_value(param, value)
     
     # =========================================================================
     # STATISTICS
@@ -1563,53 +2095,88 @@ class DashboardTab:
     def _reset_statistics(self):
         """Reset statistics collection."""
         self.error_history.clear()
+        self._err_mean = 0.0
+        self._err_m2 = 0.0
+        self._err_min_q.clear()
+        self._err_max_q.clear()
         self.session_peak_error = 0.0  # Reset session peak
-        for lbl in self.stats_labels.values():
-            lbl.config(text="--")
+        for key, lbl in self.stats_labels.items():
+            self._set_text(f"stats.{key}", lbl, "--")
     
-    def _update_statistics(self, error: float):
-        """Update statistics with new error value."""
-        self.error_history.append(error)
+    def _update_statistics(self, error: float, refresh: bool = True):
+        """
+        Record a new error value and optionally refresh the stats panel.
 
+        Running stats are updated in O(1) every tick; the label writes only
+        run when ``refresh`` is set (throttled to SLOW_REFRESH_HZ by update()).
+        """
         # Track session peak (absolute max error since reset)
         self.session_peak_error = max(self.session_peak_error, abs(error))
 
+        history = self.error_history
+        n = len(history)
+        if n == history.maxlen:
+            # Reverse Welford update for the sample about to be evicted
+            old = history[0]
+            n -= 1
+            if n:
+                delta = old - self._err_mean
+                self._err_mean -= delta / n
+                self._err_m2 -= delta * (old - self._err_mean)
+            else:
+                self._err_mean = self._err_m2 = 0.0
+        history.append(error)
+        n += 1
+        delta = error - self._err_mean
+        self._err_mean += delta / n
+        self._err_m2 += delta * (error - self._err_mean)
+
+        # Monotonic queues: front is the window min/max; drop dominated values
+        seq = self._err_seq
+        self._err_seq += 1
+        oldest = seq - history.maxlen
+        min_q, max_q = self._err_min_q, self._err_max_q
+        while min_q and min_q[-1][1] >= error:
+            min_q.pop()
+        min_q.append((seq, error))
+        if min_q[0][0] <= oldest:
+            min_q.popleft()
+        while max_q and max_q[-1][1] <= error:
+            max_q.pop()
+        max_q.append((seq, error))
+        if max_q[0][0] <= oldest:
+            max_q.popleft()
+
+        if refresh:
+            self._refresh_statistics()
+
+    def _refresh_statistics(self):
+        """Publish the running min/max/avg/std of the stats window to the labels."""
         # Use whatever samples we have instead of waiting for a minimum window
-        errors = list(self.error_history)
-
-        if not errors:
+        n = len(self.error_history)
+        if not n:
             return
 
-        avg = sum(errors) / len(errors)
-        min_err = min(errors)
-        max_err = max(errors)
-
-        # Standard deviation (sample variance for small windows)
-        variance = 0.0 if len(errors) == 1 else sum((e - avg) ** 2 for e in errors) / (len(errors) - 1)
-        std = variance ** 0.5
+        avg = self._err_mean
+        min_err = self._err_min_q[0][1]
+        max_err = self._err_max_q[0][1]
+        # Standard deviation (sample variance for small windows); clamp the
+        # tiny negative M2 that eviction round-off can leave behind
+        std = (max(self._err_m2, 0.0) / (n - 1)) ** 0.5 if n > 1 else 0.0
         
         # Stability assessment
-        stability_range = max_err - min_err
-        if stability_range < 10:
-            stability = "Excellent"
-            color = "green"
-        elif stability_range < 25:
-            stability = "Good"
-            color = "blue"
-        elif stability_range < 50:
-            stability = "Fair"
-            color = "orange"
-        else:
-            stability = "Poor"
-            color = "red"
+        stability, color = STABILITY_LABELS[
+            bisect_right(STABILITY_BANDS, max_err - min_err)
+        ]
         
         # Update labels
-        self.stats_labels['error_avg'].config(text=f"{avg:.1f}")
-        self.stats_labels['error_min'].config(text=f"{min_err:.1f}")
-        self.stats_labels['error_max'].config(text=f"{max_err:.1f}")
-        self.stats_labels['error_std'].config(text=f"{std:.1f}")
-        self.stats_labels['peak_error'].config(text=f"{self.session_peak_error:.1f}")
-        self.stats_labels['stability'].config(text=stability, foreground=color)
+        labels = self.stats_labels
+        self._set_text('stats.error_avg', labels['error_avg'], f"{avg:.1f}")
+        self._set_text('stats.error_min', labels['error_min'], f"{min_err:.1f}")
+        self._set_text('stats.error_max', labels['error_max'], f"{max_err:.1f}")
+        self._set_text('stats.error_std', labels['error_std'], f"{std:.1f}")
+        self._set_text('stats.peak_error', labels['peak_error'], f"{self.session_peak_error:.1f}")
+        self._set_text('stats.stability', labels['stability'], stability, foreground=color)
     
     # =========================================================================
     # UPDATE METHODS
@@ -1621,110 +2188,120 @@ class DashboardTab:
         
         Called by main update loop.
         """
+        # Hoist per-tick helpers to locals (LOAD_FAST instead of attribute lookups)
+        get = values.get
+        coerce = self._coerce_float
+        set_text = self._set_text
+        set_number = self._set_number
+        set_led = self._set_status_led
+
+        # Slow readouts (integrator, VFD %/Hz, stats) refresh at SLOW_REFRESH_HZ
+        self._tick += 1
+        slow_refresh = self._tick % self._slow_every == 0
+
         # Update gauges
-        cmd = self._coerce_float(values.get('cmd_limited'))
-        fb = self._coerce_float(values.get('feedback'))
-        err = self._coerce_float(values.get('error'))
-        errI = self._coerce_float(values.get('errorI'))
-        output = self._coerce_float(values.get('output'))
-        
-        self.lbl_cmd.config(text=f"{cmd:.0f}")
-        self.lbl_feedback.config(text=f"{fb:.0f}")
-        self.lbl_error.config(text=f"{err:.1f}")
-        self.lbl_errorI.config(text=f"{errI:.1f}")
-        self.lbl_output.config(text=f"{output:.1f}")
-        
-        # Update Visual RPM Bars for slip monitoring
+        cmd = coerce(get('cmd_limited'))
+        fb = coerce(get('feedback'))
+        err = coerce(get('error'))
+        errI = coerce(get('errorI'))
+        output = coerce(get('output'))
+        
+        set_number('cmd', self.lbl_cmd, cmd, '.0f')
+        set_number('feedback', self.lbl_feedback, fb, '.0f')
+        set_number('output', self.lbl_output, output, '.1f')
+        if slow_refresh:
+            set_number('errorI', self.lbl_errorI, errI, '.1f')
+        
+        # Update Visual RPM Bars for slip monitoring (configure() is a single
+        # Tcl call; item assignment costs two)
         if self.bar_cmd:
-            self.bar_cmd['value'] = abs(cmd)
+            self.bar_cmd.configure(value=abs(cmd))
         if self.bar_fb:
-            self.bar_fb['value'] = abs(fb)
+            self.bar_fb.configure(value=abs(fb))
         
         # Update Bidirectional Error Meter
-        if self.bar_error_canvas and self.bar_error_rect:
+        err_canvas, err_rect = self.bar_error_canvas, self.bar_error_rect
+        if err_canvas and err_rect:
             width = 160
             center = width / 2
             scale = 1.0  # Pixels per RPM error
             max_rpm_visual = 100.0
 
-            # Clamp visualization to canvas size
-            bar_len = max(-max_rpm_visual, min(max_rpm_visual, err)) * scale
+            # Clamp visualization to canvas size; snap to whole pixels so
+            # sub-pixel jitter doesn't cost a canvas call
+            bar_len = int(max(-max_rpm_visual, min(max_rpm_visual, err)) * scale)
             
             # Determine color based on error magnitude
-            abs_err = abs(err)
-            if abs_err < ERROR_THRESHOLD_EXCELLENT:
-                fill = "green"
-            elif abs_err < ERROR_THRESHOLD_GOOD:
-                fill = "#88AA00"  # Yellow-green
-            elif abs_err < ERROR_THRESHOLD_WARNING:
-                fill = "orange"
-            else:
-                fill = "red"
+            fill = ERROR_METER_COLORS[bisect_right(ERROR_BANDS, abs(err))]
             
             # Draw bar from center (positive = right, negative = left)
-            if bar_len >= 0:
-                self.bar_error_canvas.coords(self.bar_error_rect, center, 2, center + bar_len, 10)
+            if bar_len != self._last_bar_pix:
+                self._last_bar_pix = bar_len
+                if bar_len >= 0:
+                    err_canvas.coords(err_rect, center, 2, center + bar_len, 10)
+                else:
+                    err_canvas.coords(err_rect, center + bar_len, 2, center, 10)
+            if fill != self._last_bar_fill:
+                self._last_bar_fill = fill
+                err_canvas.itemconfig(err_rect, fill=fill)
+        
+        abs_cmd = abs(cmd)
+        if slow_refresh and abs_cmd != self._last_vfd_cmd:
+            self._last_vfd_cmd = abs_cmd
+
+            # VFD % (assuming 1800 RPM = 100%)
+            vfd_pct = abs_cmd / 1800 * 100
+            set_text('vfd_pct', self.lbl_vfd_pct, f"{vfd_pct:.0f}%")
+
+            # Calculate and display Estimated Hz (for VFD verification)
+            if hasattr(self.hal, 'rpm_to_hz'):
+                hz = self.hal.rpm_to_hz(abs_cmd)
+                set_text('hz', self.lbl_hz, f"({hz:.1f}Hz)")
             else:
-                self.bar_error_canvas.coords(self.bar_error_rect, center + bar_len, 2, center, 10)
-            self.bar_error_canvas.itemconfig(self.bar_error_rect, fill=fill)
-        
-        # VFD % (assuming 1800 RPM = 100%)
-        vfd_pct = abs(cmd) / 1800 * 100 if cmd != 0 else 0
-        self.lbl_vfd_pct.config(text=f"{vfd_pct:.0f}%")
-        
-        # Calculate and display Estimated Hz (for VFD verification)
-        if hasattr(self.hal, 'rpm_to_hz'):
-            hz = self.hal.rpm_to_hz(abs(cmd))
-            self.lbl_hz.config(text=f"({hz:.1f}Hz)")
-        else:
-            self.lbl_hz.config(text="")
+                set_text('hz', self.lbl_hz, "")
         
         # Revs counter (for threading operations)
-        revs = self._coerce_float(values.get('spindle_revs'))
-        self.lbl_revs.config(text=f"{revs:.2f}")
+        revs = coerce(get('spindle_revs'))
+        set_number('revs', self.lbl_revs, revs, '.2f')
         
         # Error color coding
-        abs_err = abs(err)
-        if abs_err <= ERROR_THRESHOLD_EXCELLENT:
-            err_color = "green"
-        elif abs_err <= ERROR_THRESHOLD_GOOD:
-            err_color = "blue"
-        elif abs_err <= ERROR_THRESHOLD_WARNING:
-            err_color = "orange"
-        else:
-            err_color = "red"
-        self.lbl_error.config(foreground=err_color)
+        err_color = ERROR_LABEL_COLORS[bisect_left(ERROR_BANDS, abs(err))]
+        set_number('error', self.lbl_error, err, '.1f', foreground=err_color)
         
         # Direction indicator (use signed feedback_raw for correct CW/CCW detection)
-        fb_raw = self._coerce_float(values.get('feedback_raw', fb), default=fb)
-        if abs(fb_raw) < 10:
-            self.lbl_direction.config(text="STOP", foreground="gray")
-        elif fb_raw > 0:
-            self.lbl_direction.config(text="CW →", foreground="green")
-        else:
-            self.lbl_direction.config(text="← CCW", foreground="blue")
+        fb_raw = coerce(get('feedback_raw', fb), default=fb)
+        dir_key = 0 if abs(fb_raw) < DIRECTION_STOP_RPM else (fb_raw > 0) - (fb_raw < 0)
+        if dir_key != self._last_dir_key:
+            self._last_dir_key = dir_key
+            text, color = DIRECTION_DISPLAY[dir_key]
+            self.lbl_direction.config(text=text, foreground=color)
         
         # Update status indicators
-        at_speed = values.get('at_speed', 0) > 0.5
-        watchdog = values.get('watchdog', 0) > 0.5
-        spindle_on = values.get('spindle_on', 0) > 0.5
-        encoder_ok = values.get('encoder_fault', 0) < 0.5
-        external_ok = values.get('safety_chain', 1.0) > 0.5
-
-        self._set_status_led('at_speed', at_speed)
-        self._set_status_led('watchdog', watchdog, warn=True)
-        self._set_status_led('spindle_on', spindle_on)
-        self._set_status_led('encoder_ok', encoder_ok)
-        self._set_status_led('safety_chain', external_ok)
-
-        if hasattr(self, 'lbl_spindle_state'):
-            self.lbl_spindle_state.config(
-                text="ENABLED" if spindle_on else "DISABLED",
-                foreground="green" if spindle_on else "red"
-            )
+        at_speed = get('at_speed', 0) > 0.5
+        watchdog = get('watchdog', 0) > 0.5
+        spindle_on = get('spindle_on', 0) > 0.5
+        encoder_ok = get('encoder_fault', 0) < 0.5
+        external_ok = get('safety_chain', 1.0) > 0.5
+
+        # Status bits rarely change; skip the whole block when none did
+        status_state = (at_speed, watchdog, spindle_on, encoder_ok, external_ok)
+        if status_state != self._last_status_state:
+            self._last_status_state = status_state
+            set_led('at_speed', at_speed)
+            set_led('watchdog', watchdog, warn=True)
+            set_led('spindle_on', spindle_on)
+            set_led('encoder_ok', encoder_ok)
+            set_led('safety_chain', external_ok)
+
+            if hasattr(self, 'lbl_spindle_state'):
+                set_text(
+                    'spindle_state', self.lbl_spindle_state,
+                    "ENABLED" if spindle_on else "DISABLED",
+                    foreground="green" if spindle_on else "red"
+                )
         
         # Update statistics
-        self._update_statistics(err)
+        self._update_statistics(err, refresh=slow_refresh)
         
         # Auto-reset statistics when spindle stops
         if self.last_cmd > 10 and cmd < 10:
@@ -1734,15 +2311,36 @@ class DashboardTab:
         self.last_feedback = fb
         self.last_cmd = cmd
         
-        # Update plot (if not paused)
-        if not self.plot_paused:
-            if HAS_MATPLOTLIB:
+        # Update plot (if not paused), decimated to every Nth tick and only
+        # when the logger produced new samples or a redraw was requested
+        if (not self.plot_paused
+                and self._tick % self._py_plot['decimation'] == 0
+                and self._plot_has_new_data()):
+            if self.fast_plot is not None:
+                self._render_plot_cv2()
+            elif HAS_MATPLOTLIB:
                 self._update_plot()
             elif isinstance(self.text_fallback, tk.Text):
                 self._update_text_fallback(values)
             else:
                 self._update_canvas_fallback(values)
     
+    def _plot_has_new_data(self) -> bool:
+        """True if the logger advanced since the last plot (or a redraw is due)."""
+        seq = getattr(self.logger, 'sample_seq', None)
+        if seq is None:
+            return True
+        if seq == self._last_plot_seq and not self.plot_dirty:
+            return False
+        self._last_plot_seq = seq
+        return True
+
+    def _read_plot_data(self):
+        """Copy the logger's plot buffers, as ndarrays when NumPy is available."""
+        if HAS_NUMPY and hasattr(self.logger, 'get_plot_data_np'):
+            return self.logger.get_plot_data_np()
+        return self.logger.get_plot_data()
+
     def _update_plot(self):
         """
         Update plot with latest data using blitting for performance.
@@ -1752,26 +2350,27 @@ class DashboardTab:
         """
         if not HAS_MATPLOTLIB or self.canvas is None:
             return
-        
-        times, trace_data = self.logger.get_plot_data()
 
+        times, trace_data = self._read_plot_data()
         if times is None or len(times) == 0:
             return
-        
-        # Update line data
-        for name, line in self.lines.items():
-            series = trace_data.get(name, [])
-            line.set_data(times, series)
+
+        active_traces = self._active_traces
+
+        # Update line data (hidden traces are refreshed once they become visible)
+        for name, line, _ in active_traces:
+            line.set_data(times, trace_data.get(name, []))
         
         # Check if we need a full redraw (axis shift, resize, etc.)
-        time_scale = self.time_scale.get()
+        time_scale = self._py_plot['time_scale']
         current_xlim = self.ax.get_xlim()
         x_max = max(times[-1], time_scale)
         x_min = max(0, x_max - time_scale)
         
         needs_full_redraw = (
             self.plot_dirty or
-            self.background is None or
+            self._blit_mgr is None or
+            not self._blit_mgr.has_background or
             times[-1] > current_xlim[1]  # X-axis needs to shift
         )
         
@@ -1779,49 +2378,32 @@ class DashboardTab:
             # Full redraw: update axes and redraw everything
             self.ax.set_xlim(x_min, x_max)
             
-            # Auto-scale y-axis
-            if self.dual_axis.get():
+            # Auto-scale y-axis over the visible traces
+            def span(names, pad):
+                series = [trace_data[n] for n in names if len(trace_data.get(n, ()))]
+                if not series:
+                    return None
+                if HAS_NUMPY:
+                    # One concatenate + two C reductions instead of per-trace passes
+                    data = np.concatenate(series)
+                    return float(data.min()) - pad, float(data.max()) + pad
+                return (min(min(d) for d in series) - pad,
+                        max(max(d) for d in series) + pad)
+
+            names = [name for name, _, _ in active_traces]
+            if self._py_plot['dual_axis']:
                 # Separate scaling for RPM and error axes
-                rpm_data = []
-                err_data = []
-                
-                for name in ['cmd', 'feedback']:
-                    if name in self.lines and name in self.show_traces and self.show_traces[name].get():
-                        data = self.lines[name].get_ydata()
-                        if len(data) > 0:
-                            rpm_data.extend(data)
-
-                for name in ['error', 'errorI']:
-                    if name in self.lines and name in self.show_traces and self.show_traces[name].get():
-                        data = self.lines[name].get_ydata()
-                        if len(data) > 0:
-                            err_data.extend(data)
-                
-                if rpm_data:
-                    y_min = min(rpm_data) - 50
-                    y_max = max(rpm_data) + 50
-                    self.ax.set_ylim(y_min, y_max)
-                
-                if err_data and self.ax2:
-                    y_min = min(err_data) - 10
-                    y_max = max(err_data) + 10
-                    self.ax2.set_ylim(y_min, y_max)
+                ylim = span([n for n in names if n not in ('error', 'errorI')], 50)
+                ylim2 = span([n for n in names if n in ('error', 'errorI')], 10)
+                if ylim2 and self.ax2:
+                    self.ax2.set_ylim(*ylim2)
             else:
-                # Single axis scaling
-                all_data = []
-                for name, line in self.lines.items():
-                    if name in self.show_traces and self.show_traces[name].get():
-                        data = line.get_ydata()
-                        if len(data) > 0:
-                            all_data.extend(data)
-                
-                if all_data:
-                    y_min = min(all_data) - 50
-                    y_max = max(all_data) + 50
-                    self.ax.set_ylim(y_min, y_max)
+                ylim = span(names, 50)
+            if ylim:
+                self.ax.set_ylim(*ylim)
             
             # Regenerate legend with only visible traces to fix de-sync issue
-            if self.dual_axis.get():
+            if self._py_plot['dual_axis']:
                 lines1 = [l for l in self.ax.get_lines() if l.get_visible()]
                 labels1 = [l.get_label() for l in lines1]
                 if self.ax2:
@@ -1840,28 +2422,12 @@ class DashboardTab:
                 elif self.ax.get_legend():
                     self.ax.get_legend().remove()
 
-            # Expensive full redraw
+            # Expensive full redraw; BlitManager recaptures the background
+            # and paints the animated lines from its draw_event callback
             self.canvas.draw()
             self.plot_dirty = False
-            # Background will be recaptured by _on_plot_draw callback
         else:
-            # Blitting with dual axes can produce artifacts; fall back to full draw
-            if self.dual_axis.get():
-                self.canvas.draw()
-                return
-
-            # Fast blitting update: restore background, draw lines, blit
-            if self.background is not None:
-                self.canvas.restore_region(self.background)
-
-                # Draw only visible animated lines on correct axis
-                for name, line in self.lines.items():
-                    if line.get_visible():
-                        if self.dual_axis.get() and name in ['error', 'errorI'] and self.ax2:
-                            self.ax2.draw_artist(line)
-                        else:
-                            self.ax.draw_artist(line)
-
-                self.canvas.blit(self.ax.bbox)
-                self.canvas.flush_events()
+            # Fast blitting update: restore background, draw lines, blit.
+            # The figure bbox covers both axes, so dual-axis mode blits too.
+            self._blit_mgr.update()
     
@@ -14,9 +14,15 @@ This module provides:
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
+import os
+import queue
 import re
+import subprocess
+import sys
+import threading
 
 try:
     import tkinter as tk
@@ -29,9 +35,25 @@ except ImportError:
     messagebox = None
     simpledialog = None
     _HAS_TKINTER = False
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
+try:
+    import ijson
+    _HAS_IJSON = True
+except ImportError:
+    ijson = None
+    _HAS_IJSON = False
+from collections import OrderedDict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, TypedDict
+from typing import Any, Dict, List, Optional, Callable, Tuple, TypedDict
 
 from config import PROFILES_DIR, BASELINE_PARAMS
 
@@ -40,7 +62,20 @@ logger = logging.getLogger(__name__)
 
 # Constants
 MAX_PROFILES_DISPLAYED: int = 10
-INVALID_FILENAME_CHARS: re.Pattern = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+PROFILE_CACHE_SIZE: int = 128
+PROFILE_REFRESH_DELAY_MS: int = 50
+# How often the Tk thread checks for finished background work
+WORKER_POLL_MS: int = 50
+# One-line file in the profiles directory listing confirmations to skip
+CONFIRM_PREFS_FILENAME: str = ".prefs"
+PROFILE_HEADER_KEYS: tuple = ('name', 'timestamp')
+# Exact JSON number types accepted as parameter values (bool is excluded)
+NUMERIC_PARAM_TYPES: tuple = (int, float)
+# Invalid filename characters, control characters and spaces all map to '_'
+FILENAME_SANITIZE_TABLE: Dict[int, str] = str.maketrans(
+    dict.fromkeys('<>:"/\\|?* ' + ''.join(map(chr, range(0x20))), '_')
+)
+ISO_MINUTE_PREFIX: re.Pattern = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}')
 
 
 class ProfileData(TypedDict, total=False):
@@ -101,8 +136,23 @@ class ExportTab:
         self.get_params = get_params_callback
         self.set_params = set_params_callback
         self._max_profiles = max_profiles
-        self._profile_paths: List[Path] = []
+        self._profile_paths: Dict[str, Path] = {}  # Tree row id -> profile path
+        self._profile_rows: List[Tuple[Path, Tuple[str, str]]] = []  # Rows currently shown
         self._profiles_dir = Path(PROFILES_DIR)
+        # Parsed profiles keyed by path -> ((st_mtime_ns, st_size), data), LRU order
+        self._profile_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._profile_header_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._refresh_pending = False
+        self._csv_export_running = False
+        self._profiles_dir_ready = False
+        self._skip_confirm: Optional[set] = None  # Loaded lazily from CONFIRM_PREFS_FILENAME
+        self._refresh_generation = 0  # Bumped per refresh; stale scan results are ignored
+        self._last_points = -1  # Count currently shown on points_label
+        # Profile caches are shared with the profile-scan worker thread
+        self._profile_cache_lock = threading.RLock()
+        # (callback, result) pairs from worker threads, run on the Tk thread
+        self._worker_results: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._workers_pending = 0
 
         self._validate_dependencies()
 
@@ -176,9 +226,10 @@ class ExportTab:
         frame = ttk.LabelFrame(self.parent, text="Export", padding="10")
         frame.pack(fill=tk.X, padx=20, pady=10)
 
-        ttk.Button(
+        self.btn_export_csv = ttk.Button(
             frame, text="Export to CSV...", command=self.export_csv
-        ).pack(side=tk.LEFT, padx=10)
+        )
+        self.btn_export_csv.pack(side=tk.LEFT, padx=10)
         ttk.Button(
             frame, text="Generate INI Section...", command=self.show_ini_config
         ).pack(side=tk.LEFT, padx=10)
@@ -205,14 +256,21 @@ class ExportTab:
         ).pack(side=tk.RIGHT, padx=10)
 
     def _setup_profiles_list(self) -> None:
-        """Set up recent profiles listbox with double-click to load."""
+        """Set up recent profiles table with double-click to load."""
         frame = ttk.LabelFrame(self.parent, text="Recent Profiles", padding="10")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        self.profiles_listbox = tk.Listbox(frame, height=6)
-        self.profiles_listbox.pack(fill=tk.BOTH, expand=True)
-        self.profiles_listbox.bind('<Double-1>', lambda e: self._load_selected_profile())
-        self.profiles_listbox.bind('<Delete>', lambda e: self._delete_selected_profile())
+        self.profiles_tree = ttk.Treeview(
+            frame, columns=('name', 'date'), show='headings',
+            selectmode='browse', height=6
+        )
+        self.profiles_tree.heading('name', text="Name", anchor=tk.W)
+        self.profiles_tree.heading('date', text="Saved", anchor=tk.W)
+        self.profiles_tree.column('name', anchor=tk.W, stretch=True)
+        self.profiles_tree.column('date', anchor=tk.W, width=140, stretch=False)
+        self.profiles_tree.pack(fill=tk.BOTH, expand=True)
+        self.profiles_tree.bind('<Double-1>', lambda e: self._load_selected_profile())
+        self.profiles_tree.bind('<Delete>', lambda e: self._delete_selected_profile())
 
         ttk.Button(
             frame, text="Refresh", command=self._refresh_profiles_list
@@ -251,6 +309,9 @@ class ExportTab:
     def update_points_display(self) -> None:
         """Update the points count display label."""
         count = self.data_logger.get_point_count()
+        if count == self._last_points:
+            return
+        self._last_points = count
         self.points_label.config(text=f"Points: {count:,}")
     
     def export_csv(self) -> None:
@@ -258,8 +319,12 @@ class ExportTab:
         Export recorded data to a CSV file.
 
         Opens a file dialog for the user to select the destination.
-        Shows success/error message based on export result.
+        The file is written on a background thread; a success/error
+        message is shown on the Tk thread when it finishes.
         """
+        if self._csv_export_running:
+            return
+
         if self.data_logger.get_point_count() == 0:
             messagebox.showwarning(
                 "No Data",
@@ -268,7 +333,7 @@ class ExportTab:
             )
             return
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._compact_timestamp(datetime.now())
         filename = f"spindle_data_{timestamp}.csv"
         filepath = filedialog.asksaveasfilename(
             parent=self._parent_window(),
@@ -278,17 +343,74 @@ class ExportTab:
         )
 
         if filepath:
+            self._csv_export_running = True
+            self.btn_export_csv.state(['disabled'])
+            self._run_in_worker(
+                "csv-export",
+                lambda: self._write_csv(filepath),
+                lambda error: self._finish_csv_export(filepath, error),
+            )
+
+    def _write_csv(self, filepath: str) -> Optional[str]:
+        """Worker thread: export the recording; returns an error message or None."""
+        try:
+            ok = self.data_logger.export_csv(Path(filepath))
+            return None if ok else "See log for details."
+        except Exception as e:
+            return str(e)
+
+    def _run_in_worker(self, name: str, work: Callable[[], Any],
+                       on_done: Callable[[Any], None]) -> None:
+        """
+        Run ``work`` on a daemon thread and pass its result to ``on_done``
+        on the Tk thread.
+
+        Tkinter must only be called from the Tk thread, so workers hand
+        their results back through _worker_results, which
+        _poll_worker_results drains while any worker is outstanding.
+        """
+        def worker() -> None:
             try:
-                self.data_logger.export_csv(Path(filepath))
-                messagebox.showinfo(
-                    "Success", f"Data exported to:\n{filepath}", parent=self._parent_window()
-                )
-                logger.info(f"CSV exported to {filepath}")
-            except (OSError, PermissionError) as e:
-                logger.error(f"CSV export failed: {e}")
-                messagebox.showerror(
-                    "Error", f"Export failed:\n{e}", parent=self._parent_window()
-                )
+                result = work()
+            except Exception as e:
+                logger.error(f"Background task '{name}' failed: {e}", exc_info=True)
+                self._worker_results.put(None)
+                return
+            self._worker_results.put((on_done, result))
+
+        self._workers_pending += 1
+        if self._workers_pending == 1:
+            self.parent.after(WORKER_POLL_MS, self._poll_worker_results)
+        threading.Thread(target=worker, name=name, daemon=True).start()
+
+    def _poll_worker_results(self) -> None:
+        """Run callbacks for finished workers; reschedules while any are pending."""
+        while True:
+            try:
+                item = self._worker_results.get_nowait()
+            except queue.Empty:
+                break
+            self._workers_pending -= 1
+            if item is not None:
+                on_done, result = item
+                on_done(result)
+        if self._workers_pending > 0:
+            self.parent.after(WORKER_POLL_MS, self._poll_worker_results)
+
+    def _finish_csv_export(self, filepath: str, error: Optional[str]) -> None:
+        """Re-enable the export button and report the result of a CSV export."""
+        self._csv_export_running = False
+        self.btn_export_csv.state(['!disabled'])
+        if error is None:
+            messagebox.showinfo(
+                "Success", f"Data exported to:\n{filepath}", parent=self._parent_window()
+            )
+            logger.info(f"CSV exported to {filepath}")
+        else:
+            logger.error(f"CSV export failed: {error}")
+            messagebox.showerror(
+                "Error", f"Export failed:\n{error}", parent=self._parent_window()
+            )
 
     def show_ini_config(self) -> None:
         """
@@ -324,7 +446,7 @@ class ExportTab:
             messagebox.showinfo("Copied", "INI section copied to clipboard.", parent=dialog)
 
         def save_to_file() -> None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = self._compact_timestamp(datetime.now())
             default_filename = f"spindle_pid_{timestamp}.ini.txt"
             save_path = filedialog.asksaveasfilename(
                 parent=dialog,
@@ -347,6 +469,23 @@ class ExportTab:
         ttk.Button(btn_frame, text="Save to File...", command=save_to_file).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Close", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
     
+    @staticmethod
+    def _compact_timestamp(now: datetime) -> str:
+        """Format a datetime as "YYYYMMDD_HHMMSS" for use in filenames."""
+        return (f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+                f"{now.hour:02d}{now.minute:02d}{now.second:02d}")
+
+    def _ensure_profiles_dir(self) -> None:
+        """
+        Create the profiles directory if it has not been confirmed yet.
+
+        Raises:
+            OSError: If the directory cannot be created
+        """
+        if not self._profiles_dir_ready:
+            self._profiles_dir.mkdir(parents=True, exist_ok=True)
+            self._profiles_dir_ready = True
+
     def _sanitize_filename(self, name: str) -> str:
         """
         Sanitize a profile name for use as a filename.
@@ -363,12 +502,9 @@ class ExportTab:
             "lpt4", "lpt5", "lpt6", "lpt7", "lpt8", "lpt9",
         }
 
-        # Replace invalid characters with underscores
-        sanitized = INVALID_FILENAME_CHARS.sub('_', name)
-        # Replace spaces with underscores
-        sanitized = sanitized.replace(' ', '_')
-        # Remove leading/trailing underscores
-        sanitized = sanitized.strip('_')
+        # Replace invalid characters and spaces with underscores in one
+        # pass, then remove leading/trailing underscores
+        sanitized = name.translate(FILENAME_SANITIZE_TABLE).strip('_')
 
         if sanitized.lower() in reserved_windows_names:
             sanitized = f"{sanitized}_profile"
@@ -414,18 +550,21 @@ class ExportTab:
             return
 
         name = name.strip()
-        params = self.get_params()
+        # Only persist parameters that _load_profile_file will accept
+        current = self.get_params()
+        params = {k: current[k] for k in BASELINE_PARAMS if k in current}
+        now = datetime.now()
 
         profile: ProfileData = {
             'name': name,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'params': params,
             'notes': ''
         }
 
         # Ensure profiles directory exists
         try:
-            self._profiles_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_profiles_dir()
         except OSError as e:
             logger.error(f"Failed to create profiles directory: {e}")
             messagebox.showerror(
@@ -434,50 +573,173 @@ class ExportTab:
             return
 
         sanitized_name = self._sanitize_filename(name)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._compact_timestamp(now)
         filename = f"{sanitized_name}_{timestamp}.json"
         filepath = self._profiles_dir / filename
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(profile, f, indent=2, ensure_ascii=False)
+            self._forget_profile(filepath)
+            if _HAS_ORJSON:
+                payload = orjson.dumps(profile, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(profile, indent=2, ensure_ascii=False).encode('utf-8')
+            self._write_file_atomic(filepath, payload)
+            self._schedule_refresh()
             messagebox.showinfo(
                 "Success", f"Profile saved:\n{filepath.name}", parent=self._parent_window()
             )
             logger.info(f"Profile saved to {filepath}")
-            self._refresh_profiles_list()
         except (OSError, PermissionError) as e:
+            # The directory may have been removed behind our back
+            self._profiles_dir_ready = False
             logger.error(f"Failed to save profile: {e}")
             messagebox.showerror(
                 "Error", f"Failed to save profile:\n{e}", parent=self._parent_window()
             )
     
-    def _parse_profile_file(self, filepath: Path) -> Optional[ProfileData]:
+    @staticmethod
+    def _write_file_atomic(filepath: Path, payload: bytes) -> None:
+        """
+        Write a file via a temporary sibling and an atomic rename.
+
+        Readers see either the previous file or the complete new one,
+        never a partially written profile.
+
+        Args:
+            filepath: Destination path
+            payload: Complete file contents
+
+        Raises:
+            OSError: If the file cannot be written or renamed
+        """
+        tmp = filepath.with_suffix(filepath.suffix + '.tmp')
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, filepath)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            raise
+
+    def _parse_profile_file(self, filepath: Path,
+                            st: Optional[os.stat_result] = None) -> Optional[ProfileData]:
         """
         Parse a profile JSON file.
 
+        Results are cached by path and invalidated when the file's
+        modification time or size changes, so refreshing the list only
+        costs a stat() per unchanged profile.
+
         Args:
             filepath: Path to the profile JSON file
+            st: The file's stat result, if the caller already has it
 
         Returns:
             ProfileData dict if successful, None if parsing fails
         """
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        key = str(filepath)
+        with self._profile_cache_lock:
+            try:
+                if st is None:
+                    st = filepath.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._profile_cache.get(key)
+                if cached is not None and cached[0] == stamp:
+                    self._profile_cache.move_to_end(key)
+                    return cached[1]
+
+                raw = filepath.read_bytes()
+                data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+
+                # Validate required structure
+                if not isinstance(data, dict):
+                    logger.warning(f"Invalid profile format in {filepath}: not a dict")
+                    self._profile_cache.pop(key, None)
+                    return None
+
+                self._remember_profile(self._profile_cache, key, stamp, data)
+                return data
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                logger.warning(f"Invalid JSON in profile {filepath}: {e}")
+                self._profile_cache.pop(key, None)
+                return None
+            except (OSError, PermissionError) as e:
+                logger.warning(f"Cannot read profile {filepath}: {e}")
+                self._profile_cache.pop(key, None)
+                return None
+
+    def _read_profile_header(self, filepath: Path,
+                             st: Optional[os.stat_result] = None) -> Optional[ProfileData]:
+        """
+        Read only the display fields ('name', 'timestamp') of a profile.
+
+        With ijson available the file is streamed and reading stops as
+        soon as both fields have been seen; otherwise the full profile is
+        parsed. Headers are cached like full profiles.
+
+        Args:
+            filepath: Path to the profile JSON file
+            st: The file's stat result, if the caller already has it
+
+        Returns:
+            ProfileData dict holding whichever header fields were found,
+            or None if the file cannot be read or parsed
+        """
+        if not _HAS_IJSON:
+            return self._parse_profile_file(filepath, st)
 
-            # Validate required structure
-            if not isinstance(data, dict):
-                logger.warning(f"Invalid profile format in {filepath}: not a dict")
+        key = str(filepath)
+        with self._profile_cache_lock:
+            try:
+                if st is None:
+                    st = filepath.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+                for cache in (self._profile_header_cache, self._profile_cache):
+                    cached = cache.get(key)
+                    if cached is not None and cached[0] == stamp:
+                        cache.move_to_end(key)
+                        return cached[1]
+
+                header: ProfileData = {}
+                with open(filepath, 'rb') as f:
+                    for k, v in ijson.kvitems(f, ''):
+                        if k in PROFILE_HEADER_KEYS:
+                            header[k] = v
+                            if len(header) == len(PROFILE_HEADER_KEYS):
+                                break
+
+                self._remember_profile(self._profile_header_cache, key, stamp, header)
+                return header
+            except (ijson.JSONError, ValueError) as e:
+                logger.warning(f"Invalid JSON in profile {filepath}: {e}")
+                self._profile_header_cache.pop(key, None)
+                return None
+            except (OSError, PermissionError) as e:
+                logger.warning(f"Cannot read profile {filepath}: {e}")
+                self._profile_header_cache.pop(key, None)
                 return None
 
-            return data
-        except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON in profile {filepath}: {e}")
-            return None
-        except (OSError, PermissionError) as e:
-            logger.warning(f"Cannot read profile {filepath}: {e}")
-            return None
+    @staticmethod
+    def _remember_profile(cache: "OrderedDict[str, tuple]", key: str,
+                          stamp: tuple, data: ProfileData) -> None:
+        """Store parsed profile data in an LRU cache, evicting the oldest entry."""
+        cache[key] = (stamp, data)
+        cache.move_to_end(key)
+        if len(cache) > PROFILE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _forget_profile(self, filepath: Path) -> None:
+        """Drop any cached data for a profile that is being rewritten or deleted."""
+        key = str(filepath)
+        with self._profile_cache_lock:
+            self._profile_cache.pop(key, None)
+            self._profile_header_cache.pop(key, None)
 
     def load_profile(self) -> None:
         """
@@ -494,15 +756,17 @@ class ExportTab:
         if filepath:
             self._load_profile_file(filepath)
 
-    def _load_profile_file(self, filepath: str) -> None:
+    def _load_profile_file(self, filepath: str,
+                           st: Optional[os.stat_result] = None) -> None:
         """
         Load profile from specified file path.
 
         Args:
             filepath: Path to the profile JSON file (as string)
+            st: The file's stat result, if the caller already has it
         """
         path = Path(filepath)
-        profile = self._parse_profile_file(path)
+        profile = self._parse_profile_file(path, st)
 
         if profile is None:
             messagebox.showerror(
@@ -525,14 +789,17 @@ class ExportTab:
             )
             return
 
-        # Filter to only known parameters with valid numeric values
+        # Filter to only known parameters with valid numeric values; walking
+        # BASELINE_PARAMS skips foreign keys up front and keeps a stable order
         known_params = {}
-        for k, v in params.items():
-            if k in BASELINE_PARAMS:
-                if isinstance(v, (int, float)) and not isinstance(v, bool):
-                    known_params[k] = float(v)
-                else:
-                    logger.warning(f"Skipping non-numeric parameter {k}={v!r} in {filepath}")
+        for k in BASELINE_PARAMS:
+            if k not in params:
+                continue
+            v = params[k]
+            if type(v) in NUMERIC_PARAM_TYPES:
+                known_params[k] = float(v)
+            else:
+                logger.warning(f"Skipping non-numeric parameter {k}={v!r} in {filepath}")
 
         if not known_params:
             messagebox.showwarning(
@@ -544,11 +811,7 @@ class ExportTab:
 
         # Format timestamp for display
         timestamp_str = profile.get('timestamp', 'Unknown')
-        try:
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            display_time = dt.strftime('%Y-%m-%d %H:%M')
-        except (ValueError, AttributeError):
-            display_time = str(timestamp_str)[:16] if timestamp_str else 'Unknown'
+        display_time = self._format_timestamp(timestamp_str) if timestamp_str else 'Unknown'
 
         # Confirmation dialog
         msg = (
@@ -558,7 +821,7 @@ class ExportTab:
             "This will update the current tuning parameters."
         )
 
-        if not messagebox.askyesno("Load Profile", msg, parent=self._parent_window()):
+        if not self._confirm('load', "Load Profile", msg):
             return
 
         self.set_params(known_params)
@@ -572,17 +835,99 @@ class ExportTab:
         Returns:
             Path to selected profile, or None if nothing selected
         """
-        selection = self.profiles_listbox.curselection()
+        selection = self.profiles_tree.selection()
         if not selection:
             return None
+        return self._profile_paths.get(selection[0])
 
-        idx = selection[0]
-        if 0 <= idx < len(self._profile_paths):
-            return self._profile_paths[idx]
-        return None
+    def _confirm(self, action: str, title: str, message: str) -> bool:
+        """
+        Ask a yes/no question with a "Don't ask again" option.
+
+        Once the user answers Yes with the box ticked, ``action`` is saved
+        to the prefs file and later calls return True without a dialog.
+        Deleting the prefs file restores the prompts.
+
+        Args:
+            action: Preference key for this confirmation ('load', 'delete')
+            title: Dialog title
+            message: Question to display
+
+        Returns:
+            True if the action should proceed
+        """
+        if self._skip_confirm is None:
+            self._skip_confirm = self._read_confirm_prefs()
+        if action in self._skip_confirm:
+            return True
+
+        parent = self._parent_window()
+        dialog = tk.Toplevel(parent)
+        dialog.title(title)
+        dialog.resizable(False, False)
+        dialog.transient(parent)
+
+        answer = tk.BooleanVar(value=False)
+        dont_ask = tk.BooleanVar(value=False)
+
+        def close(result: bool) -> None:
+            answer.set(result)
+            dialog.destroy()
+
+        ttk.Label(dialog, text=message, justify=tk.LEFT).pack(padx=20, pady=(15, 10))
+        ttk.Checkbutton(
+            dialog, text="Don't ask again", variable=dont_ask
+        ).pack(anchor=tk.W, padx=20)
+
+        buttons = ttk.Frame(dialog)
+        buttons.pack(pady=10)
+        yes = ttk.Button(buttons, text="Yes", command=lambda: close(True))
+        yes.pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="No", command=lambda: close(False)).pack(side=tk.LEFT, padx=5)
+
+        dialog.bind('<Return>', lambda e: close(True))
+        dialog.bind('<Escape>', lambda e: close(False))
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(False))
+        yes.focus_set()
+        # A grab on an unmapped window fails on X11 ("window not viewable")
+        dialog.wait_visibility()
+        dialog.grab_set()
+        dialog.wait_window()
+
+        if answer.get() and dont_ask.get():
+            self._skip_confirm.add(action)
+            self._write_confirm_prefs()
+        return answer.get()
+
+    def _read_confirm_prefs(self) -> set:
+        """Read the set of confirmations the user chose to skip."""
+        try:
+            line = (self._profiles_dir / CONFIRM_PREFS_FILENAME).read_text(encoding='utf-8')
+        except OSError:
+            return set()
+        return {a for a in line.strip().split(',') if a}
+
+    def _write_confirm_prefs(self) -> None:
+        """Persist the skipped confirmations as a single comma-separated line."""
+        line = ','.join(sorted(self._skip_confirm)) + '\n'
+        try:
+            self._ensure_profiles_dir()
+            self._write_file_atomic(
+                self._profiles_dir / CONFIRM_PREFS_FILENAME, line.encode('utf-8')
+            )
+        except OSError as e:
+            logger.warning(f"Could not save confirmation preferences: {e}")
+
+    @staticmethod
+    def _stat_profile(filepath: Path) -> Optional[os.stat_result]:
+        """Return the stat result for a profile file, or None if it is missing or unreadable."""
+        try:
+            return filepath.stat()
+        except OSError:
+            return None
 
     def _load_selected_profile(self) -> None:
-        """Load the profile currently selected in the listbox."""
+        """Load the profile currently selected in the profiles table."""
         filepath = self._get_selected_profile_path()
 
         if filepath is None:
@@ -593,20 +938,21 @@ class ExportTab:
             )
             return
 
-        if not filepath.exists():
+        st = self._stat_profile(filepath)
+        if st is None:
             messagebox.showerror(
                 "Error",
                 "Selected profile file no longer exists.\nRefreshing list...",
                 parent=self._parent_window(),
             )
-            self._refresh_profiles_list()
+            self._schedule_refresh()
             return
 
-        self._load_profile_file(str(filepath))
+        self._load_profile_file(str(filepath), st)
 
     def _delete_selected_profile(self) -> None:
         """
-        Delete the profile currently selected in the listbox.
+        Delete the profile currently selected in the profiles table.
 
         Prompts for confirmation before deletion.
         """
@@ -620,36 +966,38 @@ class ExportTab:
             )
             return
 
-        if not filepath.exists():
+        st = self._stat_profile(filepath)
+        if st is None:
             messagebox.showinfo(
                 "Delete Profile",
                 "Selected profile file no longer exists.\nRefreshing list...",
                 parent=self._parent_window(),
             )
-            self._refresh_profiles_list()
+            self._schedule_refresh()
             return
 
         # Get profile name for confirmation
-        profile = self._parse_profile_file(filepath)
+        profile = self._parse_profile_file(filepath, st)
         if profile:
             name = profile.get('name', filepath.stem)
         else:
             name = filepath.stem
 
-        if not messagebox.askyesno(
+        if not self._confirm(
+            'delete',
             "Delete Profile",
             f"Delete profile '{name}'?\n\nThis action cannot be undone.",
-            parent=self._parent_window(),
         ):
             return
 
         try:
             filepath.unlink()
+            self._forget_profile(filepath)
+            self._schedule_refresh()
             messagebox.showinfo(
                 "Deleted", f"Profile '{name}' deleted.", parent=self._parent_window()
             )
             logger.info(f"Deleted profile: {filepath}")
-            self._refresh_profiles_list()
         except (OSError, PermissionError) as e:
             logger.error(f"Failed to delete profile {filepath}: {e}")
             messagebox.showerror(
@@ -658,11 +1006,8 @@ class ExportTab:
 
     def _open_profiles_folder(self) -> None:
         """Open the profiles directory in the system file manager."""
-        import subprocess
-        import sys
-
         try:
-            self._profiles_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_profiles_dir()
         except OSError as e:
             logger.error(f"Cannot create profiles directory: {e}")
             messagebox.showerror(
@@ -672,7 +1017,6 @@ class ExportTab:
 
         try:
             if sys.platform.startswith('win'):
-                import os
                 os.startfile(str(self._profiles_dir))
             elif sys.platform == 'darwin':
                 subprocess.run(['open', str(self._profiles_dir)], check=False)
@@ -684,84 +1028,151 @@ class ExportTab:
                 "Error", f"Could not open profiles folder:\n{e}", parent=self._parent_window()
             )
     
-    def _format_profile_display(self, profile_path: Path) -> str:
+    @staticmethod
+    def _format_timestamp(timestamp: Any) -> str:
         """
-        Format a profile path for display in the listbox.
+        Format a profile timestamp as "YYYY-MM-DD HH:MM".
+
+        Timestamps written by save_profile start with that layout already,
+        so they are sliced directly; anything else goes through
+        datetime.fromisoformat.
+
+        Args:
+            timestamp: ISO 8601 timestamp from a profile
+
+        Returns:
+            Formatted date string, or the first 16 characters of the raw
+            value if it cannot be parsed
+        """
+        if isinstance(timestamp, str) and ISO_MINUTE_PREFIX.match(timestamp):
+            return f"{timestamp[0:10]} {timestamp[11:16]}"
+        try:
+            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            return dt.strftime('%Y-%m-%d %H:%M')
+        except (ValueError, AttributeError, TypeError):
+            return str(timestamp)[:16]
+
+    def _profile_display_columns(self, profile_path: Path,
+                                 st: os.stat_result) -> Tuple[str, str]:
+        """
+        Get the table columns shown for a profile.
 
         Args:
             profile_path: Path to the profile JSON file
+            st: The file's stat result from the directory scan
 
         Returns:
-            Formatted display string "name — date"
+            (name, date) strings; date is empty if unknown
         """
-        profile = self._parse_profile_file(profile_path)
+        profile = self._read_profile_header(profile_path, st)
 
         if profile:
             name = profile.get('name', profile_path.stem)
             timestamp = profile.get('timestamp', '')
 
             if timestamp:
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    date_str = dt.strftime('%Y-%m-%d %H:%M')
-                except (ValueError, AttributeError):
-                    date_str = str(timestamp)[:16]
-                return f"{name} — {date_str}"
-            return name
+                return name, self._format_timestamp(timestamp)
+            return name, ''
 
         # Fallback to filename + mtime for invalid/unreadable profiles
-        try:
-            mtime = datetime.fromtimestamp(profile_path.stat().st_mtime)
-            return f"{profile_path.stem} — {mtime.strftime('%Y-%m-%d %H:%M')}"
-        except OSError:
-            return profile_path.stem
+        mtime = datetime.fromtimestamp(st.st_mtime)
+        return profile_path.stem, mtime.strftime('%Y-%m-%d %H:%M')
 
-    def _get_file_mtime(self, path: Path) -> float:
+    def _schedule_refresh(self) -> None:
         """
-        Safely get file modification time.
-
-        Args:
-            path: Path to the file
+        Refresh the profiles list shortly, coalescing repeated requests.
 
-        Returns:
-            Modification time as float, or 0.0 if file is inaccessible
+        Only one refresh is queued at a time, so a burst of saves or
+        deletes costs a single directory scan.
         """
-        try:
-            return path.stat().st_mtime
-        except OSError:
-            return 0.0
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.parent.after(PROFILE_REFRESH_DELAY_MS, self._do_scheduled_refresh)
+
+    def _do_scheduled_refresh(self) -> None:
+        """Run a refresh queued by _schedule_refresh."""
+        self._refresh_pending = False
+        self._refresh_profiles_list()
 
     def _refresh_profiles_list(self) -> None:
         """
-        Refresh the profiles listbox with recent profiles.
+        Refresh the profiles table with recent profiles.
 
         Displays up to max_profiles most recently modified profiles,
-        sorted by modification time (newest first).
+        sorted by modification time (newest first). The directory scan
+        and header reads run on a worker thread; the table is filled in
+        on the Tk thread, and results from superseded scans are dropped.
+        """
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        self._run_in_worker(
+            "profile-scan",
+            self._scan_profiles,
+            lambda rows: self._apply_profile_rows(generation, rows),
+        )
+
+    def _scan_profiles(self) -> List[Tuple[Path, Tuple[str, str]]]:
         """
-        self.profiles_listbox.delete(0, tk.END)
-        self._profile_paths = []
+        Find the newest profiles and read their display columns.
 
+        Returns:
+            (path, (name, date)) for up to max_profiles profiles, newest first
+        """
         if not self._profiles_dir.exists():
-            return
+            return []
 
         try:
-            # Collect profile paths, filtering out inaccessible files
+            # Collect profile paths in one directory pass, filtering out
+            # inaccessible files
             profile_files = []
-            for p in self._profiles_dir.glob("*.json"):
-                mtime = self._get_file_mtime(p)
-                if mtime > 0:
-                    profile_files.append((p, mtime))
-                else:
-                    logger.warning(f"Skipping inaccessible profile: {p}")
-
-            # Sort by modification time (newest first)
-            profile_files.sort(key=lambda x: x[1], reverse=True)
-            profiles = [p for p, _ in profile_files]
+            with os.scandir(self._profiles_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        logger.warning(f"Skipping inaccessible profile: {entry.path}")
+                        continue
+                    profile_files.append((entry.path, st.st_mtime, st))
+
+            # Newest max_profiles by modification time, newest first
+            newest = heapq.nlargest(self._max_profiles, profile_files, key=itemgetter(1))
         except OSError as e:
             logger.warning(f"Error scanning profiles directory: {e}")
-            return
-
-        for profile_path in profiles[:self._max_profiles]:
-            self._profile_paths.append(profile_path)
-            display = self._format_profile_display(profile_path)
-            self.profiles_listbox.insert(tk.END, display)
+            return []
+
+        with self._profile_cache_lock:
+            # Headers are only needed for the rows being shown; drop entries
+            # for profiles that were deleted or fell off the list
+            shown = {p for p, _, _ in newest}
+            for key in [k for k in self._profile_header_cache if k not in shown]:
+                del self._profile_header_cache[key]
+
+        rows = []
+        for p, _, st in newest:
+            path = Path(p)
+            rows.append((path, self._profile_display_columns(path, st)))
+        return rows
+
+    def _apply_profile_rows(self, generation: int,
+                            rows: List[Tuple[Path, Tuple[str, str]]]) -> None:
+        """Replace the profiles table contents with the rows from a scan."""
+        if generation != self._refresh_generation:
+            return  # A newer refresh is in flight
+        if rows == self._profile_rows:
+            return  # Nothing changed; keep the rows and the user's selection
+
+        tree = self.profiles_tree
+        old_rows = tree.get_children()
+        if old_rows:
+            tree.delete(*old_rows)
+        self._profile_paths = {}
+
+        for path, columns in rows:
+            iid = tree.insert('', tk.END, values=columns)
+            self._profile_paths[iid] = path
+        self._profile_rows = rows
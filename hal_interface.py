@@ -22,17 +22,20 @@ Improvements in this version:
 import configparser
 import logging
 import math
+import os
 import platform
 import random
+import select
 import shutil
 import subprocess
 import threading
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from config import (
     # Configuration constants
@@ -85,6 +88,23 @@ except ImportError:
     HAS_LINUXCNC = False
     linuxcnc = None
 
+# The hal module can read pins, params and signals straight from HAL shared
+# memory once a component exists; get_value() needs LinuxCNC 2.8 or newer.
+try:
+    import hal as hal_module
+    HAS_HAL_MODULE = hasattr(hal_module, 'get_value')
+except ImportError:
+    HAS_HAL_MODULE = False
+    hal_module = None
+
+# NumPy is optional; the mock physics uses it to draw encoder noise in batches.
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 
 # =============================================================================
 # ENUMS AND DATA CLASSES
@@ -106,15 +126,23 @@ class SpindleDirection(Enum):
     REVERSE = -1  # M4
 
 
+# Plain-int sign per direction; avoids the Enum .value descriptor in hot paths
+DIRECTION_SIGN: Dict[SpindleDirection, int] = {d: d.value for d in SpindleDirection}
+
+
 @dataclass
 class CachedValue:
-    """Cached pin value with monotonic timestamp."""
+    """Cached pin value with monotonic expiry time."""
+    __slots__ = ('value', 'expires_mono')  # No per-entry __dict__; fields have no defaults
+
     value: float
-    timestamp_mono: float
+    expires_mono: float
     
-    def is_valid(self, ttl_seconds: float) -> bool:
-        """Check if cached value is still valid."""
-        return (time.monotonic() - self.timestamp_mono) < ttl_seconds
+    def is_valid(self, now: Optional[float] = None) -> bool:
+        """Check if cached value is still valid at ``now`` (default: current time)."""
+        if now is None:
+            now = time.monotonic()
+        return now < self.expires_mono
 
 
 @dataclass
@@ -173,6 +201,20 @@ class PhysicsParameters:
 # MOCK PHYSICS ENGINE
 # =============================================================================
 
+# Unit normal samples generated per refill of the mock encoder noise buffer
+NOISE_BATCH_SIZE = 4096
+
+# MONITOR_PINS keys written by MockPhysicsEngine.update, in output order
+MOCK_OUTPUT_KEYS = (
+    'cmd_raw', 'cmd_limited',
+    'feedback', 'feedback_raw', 'feedback_abs',
+    'error', 'errorI', 'output',
+    'at_speed', 'watchdog', 'encoder_fault', 'spindle_on',
+    'spindle_revs',
+    'dpll_timer', 'external_ok', 'safety_chain', 'encoder_scale',
+)
+
+
 class MockPhysicsEngine:
     """
     Realistic spindle physics simulation based on tuning guide.
@@ -196,14 +238,60 @@ class MockPhysicsEngine:
         self.physics = physics_params or PhysicsParameters()
         self._last_update_mono = time.monotonic()
         self._fixed_dt = deterministic_dt
-        # Deterministic noise for repeatable tests
-        self._rng = random.Random(0)
+        # Deterministic noise for repeatable tests, drawn in batches of unit
+        # normals and scaled per use
+        self._rng = np.random.default_rng(0) if HAS_NUMPY else random.Random(0)
+        self._noise_buf: List[float] = []
+        self._noise_idx = 0
+
+        # Output pins resolved once; keys missing from MONITOR_PINS are skipped
+        present = [i for i, key in enumerate(MOCK_OUTPUT_KEYS) if MONITOR_PINS.get(key)]
+        self._output_pins = tuple(MONITOR_PINS[MOCK_OUTPUT_KEYS[i]] for i in present)
+        self._output_slots = None if len(present) == len(MOCK_OUTPUT_KEYS) else tuple(present)
+        self._outputs: Dict[str, float] = dict.fromkeys(self._output_pins, 0.0)
+
+    def _next_noise(self, sigma: float) -> float:
+        """Return one normally distributed noise sample with std dev ``sigma``."""
+        if self._noise_idx >= len(self._noise_buf):
+            if HAS_NUMPY:
+                # tolist() keeps the physics math on Python floats
+                self._noise_buf = self._rng.standard_normal(NOISE_BATCH_SIZE).tolist()
+            else:
+                self._noise_buf = self._polar_normals(NOISE_BATCH_SIZE)
+            self._noise_idx = 0
+        sample = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
+        return sample * sigma
     
+    def _polar_normals(self, count: int) -> List[float]:
+        """Draw ``count`` unit normals with the Marsaglia polar method.
+
+        Keeps both samples of every accepted pair, so it needs fewer
+        uniform draws and no trig calls compared with ``random.gauss``.
+        """
+        uniform = self._rng.random
+        log = math.log
+        sqrt = math.sqrt
+        samples: List[float] = []
+        append = samples.append
+        while len(samples) < count:
+            u = 2.0 * uniform() - 1.0
+            v = 2.0 * uniform() - 1.0
+            s = u * u + v * v
+            if 0.0 < s < 1.0:
+                scale = sqrt(-2.0 * log(s) / s)
+                append(u * scale)
+                append(v * scale)
+        del samples[count:]
+        return samples
+
     def update(self) -> Dict[str, float]:
         """
         Run one physics simulation step.
 
-        Returns a dict of all simulated pin values.
+        Returns a dict of all simulated pin values. The same dict is
+        updated in place on every call; callers must not mutate it and
+        should copy it if they need a snapshot.
         """
         now = time.monotonic()
         dt = min(now - self._last_update_mono, 0.5)  # Cap dt to avoid large jumps
@@ -229,16 +317,18 @@ class MockPhysicsEngine:
             self.state.direction = SpindleDirection.STOPPED
         
         # === THERMAL TRACKING (exponential model) ===
-        thermal_tau = max(1e-6, self.physics.thermal_time_constant_min * 60)  # seconds
-        max_thermal_factor = 1.0 + (self.physics.slip_hot_pct - self.physics.slip_cold_pct) / 100
-
         if target > 0:
             self.state.time_running += dt
-            self.state.thermal_factor = 1.0 + (max_thermal_factor - 1.0) * (1.0 - math.exp(-self.state.time_running / thermal_tau))
         else:
             # Cool down faster (convection increases when spindle stops)
             self.state.time_running = max(0, self.state.time_running - dt * 2)
-            self.state.thermal_factor = 1.0 + (max_thermal_factor - 1.0) * (1.0 - math.exp(-self.state.time_running / thermal_tau))
+
+        if self.state.time_running > 0:
+            thermal_tau = max(1e-6, self.physics.thermal_time_constant_min * 60)  # seconds
+            thermal_span = (self.physics.slip_hot_pct - self.physics.slip_cold_pct) / 100
+            self.state.thermal_factor = 1.0 + thermal_span * (1.0 - math.exp(-self.state.time_running / thermal_tau))
+        else:
+            self.state.thermal_factor = 1.0  # Fully cooled; exp(0) term vanishes
         
         # === RATE LIMITING (limit2 simulation) ===
         # Use params (user-adjustable) with physics default as fallback
@@ -268,18 +358,19 @@ class MockPhysicsEngine:
             alpha *= 0.1
 
         # === DIRECTION / POLARITY ===
-        if self.state.direction != SpindleDirection.STOPPED:
+        stopped = SpindleDirection.STOPPED
+        if self.state.direction is not stopped:
             self.state.last_direction = self.state.direction
 
         active_direction = self.state.direction
-        if active_direction == SpindleDirection.STOPPED and current_rpm > 1.0:
+        if active_direction is stopped and current_rpm > 1.0:
             active_direction = self.state.last_direction
 
-        dir_mult = active_direction.value if active_direction != SpindleDirection.STOPPED else 0
+        dir_mult = DIRECTION_SIGN[active_direction]  # 0 when stopped
         command_dir = (
-            active_direction.value
-            if active_direction != SpindleDirection.STOPPED
-            else self.state.last_direction.value
+            dir_mult
+            if active_direction is not stopped
+            else DIRECTION_SIGN[self.state.last_direction]
         )
         polarity_mult = -1 if self.state.polarity_reversed else 1
         command_sign = command_dir
@@ -322,11 +413,11 @@ class MockPhysicsEngine:
             current_rpm = current_rpm * (1 - alpha) + motor_target * alpha
         
         # === ENCODER SIMULATION WITH FILTERING ===
-        base_noise = self._rng.gauss(0, self.physics.max_noise_rpm / 3) if not self.state.encoder_fault else 0
+        base_noise = self._next_noise(self.physics.max_noise_rpm / 3) if not self.state.encoder_fault else 0
         dpll_noise = 0.0
 
         if self.state.dpll_disabled and current_rpm < 200:
-            dpll_noise = self._rng.gauss(0, self.physics.low_speed_noise_rpm)
+            dpll_noise = self._next_noise(self.physics.low_speed_noise_rpm)
         
         noise = base_noise + dpll_noise
         
@@ -368,50 +459,230 @@ class MockPhysicsEngine:
         external_ok = 0.0 if (self.state.encoder_fault or self.state.vfd_fault or 
                               self.state.estop_triggered) else 1.0
         
-        outputs: Dict[str, float] = {}
+        signed_error = signed_cmd_limited - signed_rpm
+        values = (
+            # Command path
+            signed_cmd_raw, signed_cmd_limited,
+            # Feedback path (uses filtered RPM)
+            signed_rpm, signed_rpm_raw, abs_rpm,
+            # PID internals
+            signed_error, self.state.error_i, vfd_output,
+            # Status
+            1.0 if at_speed else 0.0,
+            1.0 if limited_cmd > 50 else 0.0,
+            1.0 if self.state.encoder_fault else 0.0,
+            1.0 if target > 0 else 0.0,
+            # Threading
+            self.state.revolutions,
+            # Hardware status / safety pins
+            0.0 if self.state.dpll_disabled else 100.0,
+            external_ok, external_ok, encoder_scale,
+        )
 
-        def add_if_present(key: str, value: float):
-            pin_name = MONITOR_PINS.get(key)
-            if pin_name:
-                outputs[pin_name] = value
+        if self._output_slots is not None:
+            values = [values[i] for i in self._output_slots]
+        outputs = self._outputs
+        outputs.update(zip(self._output_pins, values))
+        return outputs
 
-        # Command path
-        add_if_present('cmd_raw', signed_cmd_raw)
-        add_if_present('cmd_limited', signed_cmd_limited)
 
-        # Feedback path (uses filtered RPM)
-        add_if_present('feedback', signed_rpm)
-        add_if_present('feedback_raw', signed_rpm_raw)
-        add_if_present('feedback_abs', abs_rpm)
+# =============================================================================
+# HALCMD SESSION
+# =============================================================================
 
-        # PID internals
-        signed_error = signed_cmd_limited - signed_rpm
-        add_if_present('error', signed_error)
-        add_if_present('errorI', self.state.error_i)
-        add_if_present('output', vfd_output)
+class HalcmdSession:
+    """
+    Long-lived ``halcmd -skf`` process that runs commands over its pipes.
+
+    With -f and no file name halcmd reads commands from stdin, and in
+    script mode (-s) it prints a lone "%" line and flushes stdout whenever
+    it is ready for the next command, which delimits the replies. -k keeps
+    it running after a failed command. This saves a fork/exec of halcmd
+    per pin read or write.
+
+    Replies are returned as CompletedProcess objects like subprocess.run
+    gives, with a nonzero returncode if halcmd wrote anything to stderr.
+    A process that dies or falls out of step is restarted on next use; if
+    halcmd never shows its prompt the session marks itself unusable and
+    callers should go back to one halcmd process per command.
+    """
 
-        # Status
-        add_if_present('at_speed', 1.0 if at_speed else 0.0)
-        add_if_present('watchdog', 1.0 if limited_cmd > 50 else 0.0)
-        add_if_present('encoder_fault', 1.0 if self.state.encoder_fault else 0.0)
-        add_if_present('spindle_on', 1.0 if target > 0 else 0.0)
+    PROMPT = b'%'
+    START_TIMEOUT = 1.0  # seconds to wait for the first prompt
 
-        # Threading
-        add_if_present('spindle_revs', self.state.revolutions)
+    def __init__(self, halcmd_path: str):
+        self._halcmd_path = halcmd_path
+        self._proc: Optional[subprocess.Popen] = None
+        self._out_buf = b''
+        self._lock = threading.Lock()  # One transaction on the pipes at a time
+        self._usable = True
 
-        # Hardware status / safety pins
-        add_if_present('dpll_timer', 0.0 if self.state.dpll_disabled else 100.0)
-        add_if_present('external_ok', external_ok)
-        add_if_present('safety_chain', external_ok)
-        add_if_present('encoder_scale', encoder_scale)
+    @property
+    def usable(self) -> bool:
+        """Whether commands can be sent through this session."""
+        return self._usable
 
-        return outputs
+    def run(self, command: str, timeout: float) -> subprocess.CompletedProcess:
+        """Run one halcmd command and return its reply."""
+        return self.run_many([command], timeout)[0]
+
+    def run_many(self, commands: List[str], timeout: float) -> List[subprocess.CompletedProcess]:
+        """
+        Run several halcmd commands back to back and collect each reply.
+
+        Commands are sent one at a time so that stderr output can be
+        attributed to the command that produced it.
+
+        Raises:
+            OSError: halcmd could not be started or its pipes failed
+            subprocess.TimeoutExpired: the replies did not arrive in time
+        """
+        with self._lock:
+            if not self._usable:
+                raise OSError("halcmd session is unavailable")
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+
+            deadline = time.monotonic() + timeout
+            try:
+                results = []
+                for command in commands:
+                    self._write(f"{command}\n".encode())
+                    out, err = self._read_reply(deadline, timeout)
+                    results.append(subprocess.CompletedProcess(command, 1 if err else 0, out, err))
+                return results
+            except (OSError, subprocess.TimeoutExpired):
+                # Replies can no longer be matched to commands; start over next time
+                self._kill()
+                raise
+
+    def close(self) -> None:
+        """Ask halcmd to exit and release the pipes."""
+        with self._lock:
+            if self._proc is None:
+                return
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=1.0)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            self._kill()
+
+    def _start(self) -> None:
+        """Spawn halcmd and wait for its first prompt. Caller holds _lock."""
+        try:
+            self._proc = subprocess.Popen(
+                [self._halcmd_path, '-skf'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+            )
+            self._out_buf = b''
+            self._read_reply(time.monotonic() + self.START_TIMEOUT, self.START_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"halcmd session unavailable, using one halcmd per command: {e}")
+            self._usable = False
+            self._kill()
+            raise OSError("halcmd session failed to start") from e
+        logger.debug("Started persistent halcmd session")
+
+    def _kill(self) -> None:
+        """Terminate the halcmd process, if any. Caller holds _lock."""
+        proc, self._proc = self._proc, None
+        self._out_buf = b''
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        for pipe in (proc.stdin, proc.stdout, proc.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    def _write(self, payload: bytes) -> None:
+        fd = self._proc.stdin.fileno()
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def _read_reply(self, deadline: float, timeout: float) -> Tuple[str, str]:
+        """Read stdout up to the next prompt line, plus any stderr output."""
+        out_fd = self._proc.stdout.fileno()
+        err_fd = self._proc.stderr.fileno()
+        watch = [out_fd, err_fd]
+        out_lines: List[bytes] = []
+        err = b''
+        while True:
+            while b'\n' in self._out_buf:
+                line, self._out_buf = self._out_buf.split(b'\n', 1)
+                if line.rstrip(b'\r') != self.PROMPT:
+                    out_lines.append(line)
+                    continue
+                # stderr is unbuffered, so anything it got for this command
+                # was written before the prompt was flushed
+                while select.select([err_fd], [], [], 0)[0]:
+                    chunk = os.read(err_fd, 65536)
+                    if not chunk:
+                        break
+                    err += chunk
+                return (b'\n'.join(out_lines).decode(errors='replace'),
+                        err.decode(errors='replace'))
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self._halcmd_path, timeout)
+            ready = select.select(watch, [], [], remaining)[0]
+            if not ready:
+                raise subprocess.TimeoutExpired(self._halcmd_path, timeout)
+            if err_fd in ready:
+                chunk = os.read(err_fd, 65536)
+                if chunk:
+                    err += chunk
+                else:
+                    watch.remove(err_fd)  # Closed; stdout EOF follows shortly
+            if out_fd in ready:
+                chunk = os.read(out_fd, 65536)
+                if not chunk:
+                    raise OSError("halcmd session exited")
+                self._out_buf += chunk
 
 
 # =============================================================================
 # HAL INTERFACE
 # =============================================================================
 
+# halcmd spellings of bit pin values
+HAL_BOOL_VALUES: Dict[str, float] = {
+    'TRUE': 1.0, 'ON': 1.0, 'YES': 1.0,
+    'FALSE': 0.0, 'OFF': 0.0, 'NO': 0.0,
+}
+
+# Each distinct monitored HAL pin and the MONITOR_PINS keys that report it,
+# so a poll reads shared pins once
+PIN_TO_KEYS: Dict[str, Tuple[str, ...]] = {}
+for _key, _pin in MONITOR_PINS.items():
+    PIN_TO_KEYS[_pin] = PIN_TO_KEYS.get(_pin, ()) + (_key,)
+del _key, _pin
+
+
+def _param_bounds(meta) -> Tuple[float, float, float]:
+    """Extract min, max, and step from a TUNING_PARAMS entry, with defaults."""
+    min_val = meta[2] if len(meta) > 2 else float('-inf')
+    max_val = meta[3] if len(meta) > 3 else float('inf')
+    step = meta[4] if len(meta) > 4 else 0.0
+    return float(min_val), float(max_val), float(step)
+
+
+# (min, max, step) per tuning parameter, resolved once instead of per write
+PARAM_BOUNDS: Dict[str, Tuple[float, float, float]] = {
+    name: _param_bounds(meta) for name, meta in TUNING_PARAMS.items()
+}
+
 class HalInterface:
     """
     Hardware abstraction layer for LinuxCNC HAL.
@@ -440,6 +711,8 @@ class HalInterface:
     
     # Cache TTL in seconds
     CACHE_TTL = 0.05  # 50ms cache validity
+    CACHE_TTL_JITTER = 0.25  # Each entry lives CACHE_TTL +/- this fraction
+    CACHE_MAX_ENTRIES = 256  # Least recently used pins are evicted beyond this
     
     def __init__(self, mock: bool = False, *, connect_retries: int = 2, retry_delay: float = 0.5):
         """
@@ -451,7 +724,7 @@ class HalInterface:
             retry_delay: Seconds to wait between halcmd verification attempts
         """
         self._lock = threading.RLock()
-        self._cache: Dict[str, CachedValue] = {}
+        self._cache: "OrderedDict[str, CachedValue]" = OrderedDict()  # LRU order
         self._validated_pins: set = set()
         self._missing_pins: set = set()  # Pins confirmed to not exist (avoid repeated warnings)
         self._pin_access_mode: Dict[str, str] = {}
@@ -480,11 +753,15 @@ class HalInterface:
         self._connect_retry_delay = max(0.0, float(retry_delay))
         
         # Performance tracking
-        self._read_times: List[float] = []
         self._max_read_times = 100  # Keep last N read times
+        self._read_times: Deque[float] = deque(maxlen=self._max_read_times)
         
         # Resolve halcmd path once at init
         self._halcmd_path = shutil.which('halcmd') or 'halcmd'
+        # Persistent halcmd process for pin I/O, started once HAL is verified
+        self._halcmd_session: Optional[HalcmdSession] = None
+        # HAL component that enables direct shared-memory reads, if available
+        self._hal_component = None
         
         # Determine mode - use mock if:
         # 1. Explicitly requested (mock=True)
@@ -569,6 +846,9 @@ class HalInterface:
         """Initialize mock mode."""
         logger.info("Initializing mock mode")
 
+        self._close_halcmd_session()
+        self._close_hal_component()
+
         if preserve_state:
             self._mock_fallback_active = True
         else:
@@ -595,6 +875,87 @@ class HalInterface:
             text=True,
             timeout=timeout,
         )
+
+    def _halcmd_exec(self, command: str, *, timeout: float = 1.0) -> subprocess.CompletedProcess:
+        """
+        Run one halcmd command in script mode, via the persistent session if possible.
+
+        Args:
+            command: halcmd command line (e.g., 'getp pin.name')
+            timeout: Command timeout in seconds
+
+        Returns:
+            CompletedProcess result
+        """
+        session = self._halcmd_session
+        if session is not None and session.usable:
+            try:
+                return session.run(command, timeout)
+            except OSError as e:
+                logger.debug(f"halcmd session failed, running command directly: {e}")
+        return self._run_halcmd(['-s', *command.split()], timeout=timeout)
+
+    def _halcmd_exec_many(
+        self, commands: List[str], *, timeout: float
+    ) -> Optional[List[subprocess.CompletedProcess]]:
+        """
+        Run several halcmd commands through the persistent session.
+
+        Returns:
+            One CompletedProcess per command, or None if the session is not
+            available and the caller should run halcmd itself
+        """
+        session = self._halcmd_session
+        if session is None or not session.usable:
+            return None
+        try:
+            return session.run_many(commands, timeout)
+        except OSError as e:
+            logger.debug(f"halcmd session failed, running commands directly: {e}")
+            return None
+
+    def _close_halcmd_session(self) -> None:
+        """Stop the persistent halcmd process, if one is running."""
+        session, self._halcmd_session = self._halcmd_session, None
+        if session is not None:
+            session.close()
+
+    def _open_hal_component(self) -> None:
+        """Create the HAL component that lets pins be read without halcmd."""
+        self._close_hal_component()
+        if not HAS_HAL_MODULE:
+            return
+        try:
+            component = hal_module.component(f"spindle-tuner-{os.getpid()}")
+            component.ready()
+            self._hal_component = component
+            logger.info("Reading HAL pins directly via the hal module")
+        except Exception as e:
+            logger.warning(f"hal module unavailable, reading pins via halcmd: {e}")
+
+    def _close_hal_component(self) -> None:
+        """Remove the HAL component, if one was created."""
+        component, self._hal_component = self._hal_component, None
+        if component is not None:
+            try:
+                component.exit()
+            except Exception as e:
+                logger.debug(f"Error removing HAL component: {e}")
+
+    def _read_hal_direct(self, pin_name: str) -> Optional[float]:
+        """Read a pin, param or signal from HAL shared memory, or None if unavailable."""
+        if self._hal_component is None:
+            return None
+        try:
+            return float(hal_module.get_value(pin_name))
+        except Exception:
+            return None  # Unknown name or HAL went away; halcmd will report it
+
+    def close(self) -> None:
+        """Release HAL resources held by this interface."""
+        with self._lock:
+            self._close_halcmd_session()
+            self._close_hal_component()
     
     def _verify_halcmd_connection(self) -> bool:
         """
@@ -663,7 +1024,11 @@ class HalInterface:
                         self._linuxcnc_cmd = None
                         self._linuxcnc_stat = None
 
-                # halcmd verification passed - we're connected
+                # halcmd verification passed - we're connected. The session
+                # process is started on first use.
+                self._close_halcmd_session()
+                self._halcmd_session = HalcmdSession(self._halcmd_path)
+                self._open_hal_component()
                 self._state = ConnectionState.CONNECTED
                 self._mock_fallback_active = False
                 self._last_error = None
@@ -698,6 +1063,7 @@ class HalInterface:
                 'is_linux': IS_LINUX,
                 'has_halcmd': HAS_HALCMD,
                 'has_linuxcnc': HAS_LINUXCNC,
+                'direct_hal_reads': self._hal_component is not None,
                 'connect_attempts': self._connect_attempts,
                 'last_error': self._last_error,
                 'cache_size': len(self._cache),
@@ -725,10 +1091,16 @@ class HalInterface:
             return 0.0
 
         with self._lock:
+            # One clock read serves both the freshness check and the new entry;
+            # the TTL therefore counts from the lookup, so a slow read makes the
+            # entry expire that much early, which only costs an earlier re-read
+            now = time.monotonic()
+
             # Check cache
-            if use_cache and pin_name in self._cache:
-                cached = self._cache[pin_name]
-                if cached.is_valid(self.CACHE_TTL):
+            if use_cache:
+                cached = self._cache.get(pin_name)
+                if cached is not None and cached.is_valid(now):
+                    self._cache.move_to_end(pin_name)
                     return cached.value
 
             # Get value
@@ -739,15 +1111,50 @@ class HalInterface:
 
             # Update cache
             if ok:
-                self._cache[pin_name] = CachedValue(value, time.monotonic())
+                self._store_cached(pin_name, value, now)
 
             return value
 
-    def _get_mock_value(self, pin_name: str) -> Tuple[float, bool]:
-        """Get simulated value for pin. Thread-safe via RLock."""
+    def _cache_expiry(self, now: float) -> float:
+        """
+        Expiry time for a cache entry stored at ``now``.
+
+        The TTL is jittered per entry so pins cached by one bulk read do not
+        all expire, and get re-read, on the same tick.
+        """
+        jitter = self.CACHE_TTL_JITTER
+        return now + self.CACHE_TTL * (1.0 - jitter + 2.0 * jitter * random.random())
+
+    def _store_cached(self, pin_name: str, value: float, now: float) -> None:
+        """
+        Cache a pin value read at ``now``, evicting the least recently used
+        entry if the cache is full.
+
+        Note: Caller MUST hold self._lock before calling this method.
+        """
+        cache = self._cache
+        cache[pin_name] = CachedValue(value, self._cache_expiry(now))
+        cache.move_to_end(pin_name)
+        if len(cache) > self.CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+    def _cache_values(self, values: Dict[str, float]) -> None:
+        """Store freshly read pin values in the cache."""
+        if not values:
+            return
         with self._lock:
-            self._update_mock_values()
-            return self._mock_values.get(pin_name, 0.0), True
+            now = time.monotonic()
+            for pin, val in values.items():
+                self._store_cached(pin, val, now)
+
+    def _get_mock_value(self, pin_name: str) -> Tuple[float, bool]:
+        """
+        Get simulated value for pin.
+
+        Note: Caller MUST hold self._lock before calling this method.
+        """
+        self._update_mock_values()
+        return self._mock_values.get(pin_name, 0.0), True
 
     def _update_mock_values(self):
         """
@@ -775,19 +1182,20 @@ class HalInterface:
         - Boolean bit pins: TRUE/FALSE, ON/OFF, YES/NO
         - Rejects NaN and Inf values
         """
-        s = text.strip().upper()
-        if not s:
-            raise ValueError("Empty HAL value")
-        
-        # Handle boolean bit pins
-        if s in ('TRUE', 'ON', 'YES'):
-            return 1.0
-        if s in ('FALSE', 'OFF', 'NO'):
-            return 0.0
-        
-        # Handle numeric values
-        val = float(text.strip())
-        if math.isnan(val) or math.isinf(val):
+        # Numeric values are the common case; float() ignores surrounding whitespace
+        try:
+            val = float(text)
+        except ValueError:
+            s = text.strip().upper()
+            if not s:
+                raise ValueError("Empty HAL value") from None
+            # Handle boolean bit pins
+            bool_val = HAL_BOOL_VALUES.get(s)
+            if bool_val is None:
+                raise
+            return bool_val
+
+        if not math.isfinite(val):
             raise ValueError(f"Non-finite HAL value: {text.strip()}")
         return val
     
@@ -802,6 +1210,10 @@ class HalInterface:
             if pin_name in self._missing_pins:
                 return 0.0, False
 
+        value = self._read_hal_direct(pin_name)
+        if value is not None and math.isfinite(value):
+            return value, True
+
         cached_accessor = self._get_cached_accessor(pin_name)
         accessors = [cached_accessor] if cached_accessor else []
         accessors.extend([cmd for cmd in ('getp', 'gets') if cmd not in accessors])
@@ -809,7 +1221,7 @@ class HalInterface:
         all_failed = True
         for cmd in accessors:
             try:
-                result = self._run_halcmd(['-s', cmd, pin_name], timeout=1.0)
+                result = self._halcmd_exec(f"{cmd} {pin_name}", timeout=1.0)
 
                 if result.returncode != 0:
                     # Don't log here - we'll log once if all accessors fail
@@ -859,6 +1271,18 @@ class HalInterface:
         with self._lock:
             pin_list = [p for p in dict.fromkeys(pin_names) if p not in self._missing_pins]
 
+        # Direct shared-memory reads need no halcmd at all; only pins they
+        # cannot resolve continue down the halcmd path
+        if self._hal_component is not None:
+            unresolved = []
+            for pin in pin_list:
+                val = self._read_hal_direct(pin)
+                if val is not None and math.isfinite(val):
+                    values[pin] = val
+                else:
+                    unresolved.append(pin)
+            pin_list = unresolved
+
         # Resolve accessors for unknown pins up front so signals don't get stuck
         # behind repeated getp failures in bulk mode.
         pending_bulk: List[Tuple[str, str]] = []
@@ -898,22 +1322,20 @@ class HalInterface:
                 if not ok:
                     continue
                 values[pin] = val
-            if values:
-                with self._lock:
-                    now = time.monotonic()
-                    for pin, val in values.items():
-                        self._cache[pin] = CachedValue(val, now)
+            self._cache_values(values)
             return values
 
         try:
             timeout = max(2.0, len(pending_bulk) * 0.15)
-            result = subprocess.run(
-                [self._halcmd_path, '-s'],
-                input=cmd_str,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            replies = self._halcmd_exec_many(commands, timeout=timeout)
+            if replies is None:
+                result = subprocess.run(
+                    [self._halcmd_path, '-s'],
+                    input=cmd_str,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
         except subprocess.TimeoutExpired:
             logger.error("Timeout reading HAL pins (bulk)")
             return values
@@ -921,6 +1343,22 @@ class HalInterface:
             logger.error(f"Error running bulk halcmd: {e}")
             return values
 
+        if replies is not None:
+            # The session returns one reply per command, so a failed pin
+            # cannot shift the others; only the failures are retried
+            all_parsed = True
+            for (pin, _), reply in zip(pending_bulk, replies):
+                try:
+                    if reply.returncode != 0:
+                        raise ValueError(reply.stderr.strip() or "halcmd error")
+                    values[pin] = self._parse_hal_value(reply.stdout)
+                except ValueError:
+                    all_parsed = False
+            if not all_parsed:
+                return _fallback_individual_reads()
+            self._cache_values(values)
+            return values
+
         # If halcmd signaled an error, avoid trusting positional mapping
         if result.returncode != 0:
             logger.warning(f"halcmd bulk read returned error; falling back: {result.stderr}")
@@ -957,12 +1395,7 @@ class HalInterface:
         for (pin, _), parsed in zip(pending_bulk, parsed_values):
             values[pin] = parsed
 
-        if values:
-            with self._lock:
-                now = time.monotonic()  # Capture inside lock for consistency
-                for pin, val in values.items():
-                    self._cache[pin] = CachedValue(val, now)
-
+        self._cache_values(values)
         return values
     
     def get_all_values(self) -> Dict[str, float]:
@@ -979,18 +1412,13 @@ class HalInterface:
             # Single physics update for all values
             with self._lock:
                 self._update_mock_values()
-                for key, pin in MONITOR_PINS.items():
-                    values[key] = self._mock_values.get(pin, 0.0)
+                mock_get = self._mock_values.get
+                values = {key: mock_get(pin, 0.0) for key, pin in MONITOR_PINS.items()}
         else:
-            # Map unique pins to their keys to avoid duplicate reads
-            pin_map: Dict[str, List[str]] = {}
-            for key, pin in MONITOR_PINS.items():
-                pin_map.setdefault(pin, []).append(key)
-
-            # Bulk read pins to minimize halcmd calls
-            bulk_values = self._read_hal_pins_bulk(list(pin_map.keys()))
+            # Bulk read each unique pin once to minimize halcmd calls
+            bulk_values = self._read_hal_pins_bulk(list(PIN_TO_KEYS))
 
-            for pin, keys in pin_map.items():
+            for pin, keys in PIN_TO_KEYS.items():
                 val = bulk_values.get(pin)
                 if val is None:
                     # Fallback to individual read if missing from bulk output
@@ -1002,8 +1430,6 @@ class HalInterface:
         elapsed = time.monotonic() - start_time
         with self._lock:
             self._read_times.append(elapsed)
-            if len(self._read_times) > self._max_read_times:
-                self._read_times.pop(0)
 
         return values
     
@@ -1069,11 +1495,10 @@ class HalInterface:
     @staticmethod
     def _get_param_bounds(param_name: str) -> Tuple[float, float, float]:
         """Safely extract min, max, and step from TUNING_PARAMS with defaults."""
-        meta = TUNING_PARAMS.get(param_name, [])
-        min_val = meta[2] if len(meta) > 2 else float('-inf')
-        max_val = meta[3] if len(meta) > 3 else float('inf')
-        step = meta[4] if len(meta) > 4 else 0.0
-        return float(min_val), float(max_val), float(step)
+        bounds = PARAM_BOUNDS.get(param_name)
+        if bounds is None:
+            bounds = _param_bounds(TUNING_PARAMS.get(param_name, ()))
+        return bounds
     
     def set_param(self, param_name: str, value: float) -> bool:
         """
@@ -1105,12 +1530,12 @@ class HalInterface:
         original_value = value
         value = self._clamp_and_snap(value, min_val, max_val, step)
         if value != original_value:
-            logger.debug(f"Adjusted {param_name} from {original_value} -> {value} (range/step)")
+            logger.debug("Adjusted %s from %s -> %s (range/step)", param_name, original_value, value)
 
         if self.is_mock:
             with self._lock:
                 self._mock_state.params[param_name] = value
-            logger.debug(f"[MOCK] Set {param_name} = {value}")
+            logger.debug("[MOCK] Set %s = %s", param_name, value)
             return True
 
         try:
@@ -1120,7 +1545,7 @@ class HalInterface:
                 return False
 
             pin_name = meta[0]
-            result = self._run_halcmd(['setp', pin_name, str(value)], timeout=2.0)
+            result = self._halcmd_exec(f"setp {pin_name} {value}", timeout=2.0)
             
             if result.returncode == 0:
                 # Invalidate cache
@@ -1200,11 +1625,11 @@ class HalInterface:
                     updated += 1
                     if clamped_value != numeric_value:
                         logger.debug(
-                            f"[MOCK] Adjusted {name} from {numeric_value} -> {clamped_value}"
+                            "[MOCK] Adjusted %s from %s -> %s", name, numeric_value, clamped_value
                         )
 
             if updated:
-                logger.debug(f"[MOCK] Bulk set {updated} params")
+                logger.debug("[MOCK] Bulk set %s params", updated)
             # Success if any known params were set
             return updated > 0
 
@@ -1244,13 +1669,20 @@ class HalInterface:
                 return False
 
             cmd_str = '\n'.join(commands)
-            result = subprocess.run(
-                [self._halcmd_path],
-                input=cmd_str,
-                capture_output=True,
-                text=True,
-                timeout=3.0
-            )
+            replies = self._halcmd_exec_many(commands, timeout=3.0)
+            if replies is not None:
+                failed = [reply for reply in replies if reply.returncode != 0]
+                result = subprocess.CompletedProcess(
+                    cmd_str, 1 if failed else 0, '', ''.join(r.stderr for r in failed)
+                )
+            else:
+                result = subprocess.run(
+                    [self._halcmd_path],
+                    input=cmd_str,
+                    capture_output=True,
+                    text=True,
+                    timeout=3.0
+                )
 
             # Invalidate cache for all attempted pins even on partial failure
             with self._lock:
@@ -1469,6 +1901,12 @@ class HalInterface:
             if pin_name in self._missing_pins:
                 return False
 
+        # Anything the hal module can read exists; no halcmd round-trip needed
+        if self._read_hal_direct(pin_name) is not None:
+            with self._lock:
+                self._validated_pins.add(pin_name)
+            return True
+
         try:
             cached_accessor = self._get_cached_accessor(pin_name)
             accessors = [cached_accessor] if cached_accessor else []
@@ -1476,7 +1914,7 @@ class HalInterface:
 
             exists = False
             for cmd in accessors:
-                result = self._run_halcmd(['-s', cmd, pin_name], timeout=1.0)
+                result = self._halcmd_exec(f"{cmd} {pin_name}", timeout=1.0)
                 if result.returncode == 0:
                     exists = True
                     with self._lock:
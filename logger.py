@@ -19,6 +19,15 @@ from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
 from config import UPDATE_INTERVAL_MS, HISTORY_DURATION_S, PLOT_TRACES
 
+# NumPy is optional; when present the plot buffers live in a preallocated
+# ndarray ring so plotting gets arrays without list->array conversion.
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 log = logging.getLogger(__name__)
 
 
@@ -82,11 +91,21 @@ class DataLogger:
         interval_ms = UPDATE_INTERVAL_MS if UPDATE_INTERVAL_MS > 0 else 1
         self.buffer_size = max(1, int(buffer_duration_s * 1000 / interval_ms))
 
-        # Circular buffers for plotting (time-limited)
-        self.time_buffer: Deque[float] = deque(maxlen=self.buffer_size)
-        self.trace_buffers: Dict[str, Deque[float]] = {
-            name: deque(maxlen=self.buffer_size) for name in PLOT_TRACES
-        }
+        # Circular buffers for plotting (time-limited). With NumPy: one
+        # (1 + traces) x 2N float64 ring, row 0 = time. Each sample is written
+        # at column i and i + N, so the latest window is always one contiguous
+        # slice. Without NumPy: per-trace deques.
+        self._trace_names: Tuple[str, ...] = tuple(PLOT_TRACES)
+        if HAS_NUMPY:
+            self._ring = np.zeros((1 + len(self._trace_names), 2 * self.buffer_size))
+            self._ring_head = 0   # Next write column in [0, N)
+            self._ring_count = 0  # Valid samples in the window
+        else:
+            self._ring = None
+            self.time_buffer: Deque[float] = deque(maxlen=self.buffer_size)
+            self.trace_buffers: Dict[str, Deque[float]] = {
+                name: deque(maxlen=self.buffer_size) for name in PLOT_TRACES
+            }
 
         # Full session recording (unlimited, for export)
         self.recording: bool = True
@@ -95,6 +114,10 @@ class DataLogger:
         # Session tracking
         self._start_time_mono: Optional[float] = None
 
+        # Monotonic count of samples added; lets consumers skip redraws when
+        # nothing new arrived (never reset, so clears still look like change)
+        self.sample_seq: int = 0
+
     # ---------------------------------------------------------------------
     # Data ingestion / retrieval
     # ---------------------------------------------------------------------
@@ -116,12 +139,24 @@ class DataLogger:
                 self._start_time_mono = now_mono
 
             relative_time = now_mono - self._start_time_mono
+            self.sample_seq += 1
 
-            self.time_buffer.append(relative_time)
-            for name in list(self.trace_buffers):
-                self.trace_buffers[name].append(
-                    self._safe_float(values.get(name, 0.0))
+            if self._ring is not None:
+                column = [relative_time]
+                column.extend(
+                    self._safe_float(values.get(name, 0.0)) for name in self._trace_names
                 )
+                head = self._ring_head
+                self._ring[:, head] = column
+                self._ring[:, head + self.buffer_size] = column
+                self._ring_head = (head + 1) % self.buffer_size
+                self._ring_count = min(self._ring_count + 1, self.buffer_size)
+            else:
+                self.time_buffer.append(relative_time)
+                for name in list(self.trace_buffers):
+                    self.trace_buffers[name].append(
+                        self._safe_float(values.get(name, 0.0))
+                    )
 
             if not self.recording:
                 return
@@ -140,29 +175,56 @@ class DataLogger:
                 )
             )
 
+    def _ring_window(self):
+        """Contiguous (1 + traces) x count view of the latest samples; hold _lock."""
+        end = self._ring_head + self.buffer_size
+        return self._ring[:, end - self._ring_count:end]
+
     def get_plot_data(self) -> Tuple[List[float], Dict[str, List[float]]]:
         """Get a copy of time-series buffers for plotting (thread-safe)."""
         with self._lock:
+            if self._ring is not None:
+                rows = self._ring_window().tolist()
+                return rows[0], dict(zip(self._trace_names, rows[1:]))
             return (
                 list(self.time_buffer),
                 {name: list(buf) for name, buf in self.trace_buffers.items()},
             )
 
-    def clear_buffers(self) -> None:
-        """Clear all plot buffers without altering the session clock."""
+    def get_plot_data_np(self) -> Tuple["np.ndarray", Dict[str, "np.ndarray"]]:
+        """
+        Get a copy of the plot buffers as float64 ndarrays (thread-safe).
+
+        The copy is a single block memcpy of the ring window; callers may hand
+        the arrays straight to matplotlib. Requires NumPy.
+        """
+        if self._ring is None:
+            raise RuntimeError("get_plot_data_np requires NumPy")
         with self._lock:
+            window = self._ring_window().copy()
+        return window[0], dict(zip(self._trace_names, window[1:]))
+
+    def _clear_plot_buffers(self) -> None:
+        """Empty the plot buffers; caller holds _lock."""
+        if self._ring is not None:
+            self._ring_head = 0
+            self._ring_count = 0
+        else:
             self.time_buffer.clear()
             for buf in self.trace_buffers.values():
                 buf.clear()
 
+    def clear_buffers(self) -> None:
+        """Clear all plot buffers without altering the session clock."""
+        with self._lock:
+            self._clear_plot_buffers()
+
     def clear_recording(self) -> None:
         """Clear recorded data (export history) and reset timing."""
         with self._lock:
             self.recorded_data.clear()
             self._start_time_mono = None
-            self.time_buffer.clear()
-            for buf in self.trace_buffers.values():
-                buf.clear()
+            self._clear_plot_buffers()
 
     def set_recording(self, enabled: bool) -> None:
         """Enable or disable data recording."""
@@ -197,7 +259,7 @@ class DataLogger:
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
 
-            with filepath.open("w", newline="", encoding="utf-8") as f:
+            with filepath.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
                 writer = csv.writer(f)
 
                 if metadata:
@@ -220,8 +282,7 @@ class DataLogger:
                     ]
                 )
 
-                for point in data_copy:
-                    writer.writerow(point.to_csv_row())
+                writer.writerows(point.to_csv_row() for point in data_copy)
 
             return True
         except OSError as exc:
@@ -23,7 +23,7 @@ from tkinter import ttk, messagebox
 from config import APP_TITLE, APP_VERSION, UPDATE_INTERVAL_MS
 from hal_interface import HalInterface, IniFileHandler, ConnectionState
 from logger import DataLogger
-from dashboard import DashboardTab
+from dashboard import DashboardTab, HAS_MATPLOTLIB, MATPLOTLIB_MIN_VERSION, matplotlib_version_ok
 from tests import TestsTab, ChecklistsTab  # Now imports from tests/ package
 from troubleshooter import TroubleshooterTab
 from export import ExportTab
@@ -70,6 +70,12 @@ class SpindleTunerApp:
         
         # Initialize core services
         logger.info("Initializing core services...")
+        if HAS_MATPLOTLIB and not matplotlib_version_ok():
+            logger.warning(
+                "matplotlib < %d.%d detected; plot blitting will be slower "
+                "(upgrade: pip install 'matplotlib>=%d.%d')",
+                *MATPLOTLIB_MIN_VERSION, *MATPLOTLIB_MIN_VERSION,
+            )
         self.hal = HalInterface(mock=mock)
         self.logger = DataLogger()
         self.ini_handler = IniFileHandler()
@@ -523,6 +529,7 @@ class SpindleTunerApp:
                 logger.warning("Failed to issue spindle stop on exit")
 
         self._hal_stop_event.set()
+        self.hal.close()
 
         logger.info("Application closing...")
         self.root.destroy()
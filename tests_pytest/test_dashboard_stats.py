@@ -0,0 +1,53 @@
+"""Tests for the dashboard's sliding-window error statistics."""
+
+import random
+import statistics
+from collections import deque
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from dashboard import DashboardTab
+
+
+def _stats_tab(window: int) -> DashboardTab:
+    """Build a DashboardTab with only the statistics state initialised."""
+    tab = DashboardTab.__new__(DashboardTab)
+    tab.error_history = deque(maxlen=window)
+    tab._err_seq = 0
+    tab._err_mean = 0.0
+    tab._err_m2 = 0.0
+    tab._err_min_q = deque()
+    tab._err_max_q = deque()
+    tab.session_peak_error = 0.0
+    return tab
+
+
+def test_running_stats_match_window_past_capacity():
+    """Mean, std, min and max should track the window as old samples are evicted."""
+    window = 8
+    tab = _stats_tab(window)
+    rng = random.Random(1)
+    # Random values, a rising run, a falling run and repeats, so the eviction
+    # path has to drop the current min and max out of the window
+    samples = [rng.uniform(-50.0, 50.0) for _ in range(40)]
+    samples += [float(v) for v in range(20)] + [float(v) for v in range(20, 0, -1)]
+    samples += [7.5] * 12
+
+    seen = []
+    for error in samples:
+        tab._update_statistics(error, refresh=False)
+        seen.append(error)
+        expected = seen[-window:]
+        n = len(tab.error_history)
+
+        assert n == len(expected)
+        assert tab._err_mean == pytest.approx(statistics.mean(expected), abs=1e-9)
+        assert tab._err_min_q[0][1] == min(expected)
+        assert tab._err_max_q[0][1] == max(expected)
+        if n > 1:
+            std = (max(tab._err_m2, 0.0) / (n - 1)) ** 0.5
+            assert std == pytest.approx(statistics.stdev(expected), abs=1e-6)
+
+    assert tab.session_peak_error == max(abs(v) for v in samples)
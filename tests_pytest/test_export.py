@@ -0,0 +1,117 @@
+"""Tests for profile caching and atomic profile writes in the export tab."""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+import export
+from export import ExportTab
+
+
+def _profile_tab(profiles_dir: Path) -> ExportTab:
+    """Build an ExportTab with only the profile cache state initialised."""
+    tab = ExportTab.__new__(ExportTab)
+    tab._profiles_dir = profiles_dir
+    tab._max_profiles = 50
+    tab._profile_cache = OrderedDict()
+    tab._profile_header_cache = OrderedDict()
+    tab._profile_cache_lock = threading.RLock()
+    return tab
+
+
+def _write_profile(path: Path, data: dict, mtime_ns: int) -> None:
+    """Write a profile and pin its mtime so cache stamps are deterministic."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_parsed_profile_cache_invalidates_on_rewrite(tmp_path):
+    """A changed mtime or size re-parses the profile; an unchanged file does not."""
+    tab = _profile_tab(tmp_path)
+    path = tmp_path / "a.json"
+    _write_profile(path, {"name": "one"}, 1_000_000_000)
+
+    first = tab._parse_profile_file(path)
+    assert first == {"name": "one"}
+    assert tab._parse_profile_file(path) is first  # Served from the cache
+
+    # Same size, new mtime
+    _write_profile(path, {"name": "two"}, 2_000_000_000)
+    assert tab._parse_profile_file(path) == {"name": "two"}
+
+    # Same mtime, new size
+    _write_profile(path, {"name": "three!"}, 2_000_000_000)
+    assert tab._parse_profile_file(path) == {"name": "three!"}
+
+    # A file that turns invalid is dropped from the cache
+    path.write_text("[1, 2]", encoding="utf-8")
+    assert tab._parse_profile_file(path) is None
+    assert str(path) not in tab._profile_cache
+
+
+def test_write_file_atomic_replaces_contents(tmp_path):
+    """A successful write replaces the file and leaves no temp file."""
+    path = tmp_path / "profile.json"
+    path.write_bytes(b"old")
+
+    ExportTab._write_file_atomic(path, b"new")
+
+    assert path.read_bytes() == b"new"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["profile.json"]
+
+
+def test_write_file_atomic_cleans_up_on_error(tmp_path, monkeypatch):
+    """A failed rename keeps the old file and removes the temp file."""
+    path = tmp_path / "profile.json"
+    path.write_bytes(b"old")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(export.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        ExportTab._write_file_atomic(path, b"new")
+
+    assert path.read_bytes() == b"old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["profile.json"]
+
+
+@pytest.mark.skipif(not export._HAS_IJSON, reason="header cache needs ijson")
+def test_profile_header_cache_invalidates_on_rewrite(tmp_path):
+    """Cached headers are reused until the profile's mtime or size changes."""
+    tab = _profile_tab(tmp_path)
+    path = tmp_path / "a.json"
+    _write_profile(path, {"name": "one", "timestamp": "t1", "params": {}}, 1_000_000_000)
+
+    first = tab._read_profile_header(path)
+    assert first == {"name": "one", "timestamp": "t1"}
+    assert tab._read_profile_header(path) is first
+
+    _write_profile(path, {"name": "two", "timestamp": "t2", "params": {}}, 2_000_000_000)
+    assert tab._read_profile_header(path) == {"name": "two", "timestamp": "t2"}
+
+
+@pytest.mark.skipif(not export._HAS_IJSON, reason="header cache needs ijson")
+def test_profile_scan_prunes_headers_for_unlisted_profiles(tmp_path):
+    """A scan drops cached headers for deleted profiles and ones off the list."""
+    tab = _profile_tab(tmp_path)
+    tab._max_profiles = 2
+    for i, name in enumerate(("old", "mid", "new")):
+        _write_profile(tmp_path / f"{name}.json", {"name": name}, (i + 1) * 1_000_000_000)
+
+    rows = tab._scan_profiles()
+    assert [cols[0] for _, cols in rows] == ["new", "mid"]
+    assert set(tab._profile_header_cache) == {
+        str(tmp_path / "new.json"), str(tmp_path / "mid.json")
+    }
+
+    (tmp_path / "new.json").unlink()
+    rows = tab._scan_profiles()
+    assert [cols[0] for _, cols in rows] == ["mid", "old"]
+    assert str(tmp_path / "new.json") not in tab._profile_header_cache
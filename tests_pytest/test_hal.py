@@ -1,11 +1,13 @@
 """Unit tests for HAL helper behaviors and mock physics."""
 
 import math
+import sys
 import time
 
 import pytest
 
-from hal_interface import HalInterface
+import hal_interface
+from hal_interface import HalcmdSession, HalInterface
 
 
 def test_clamp_and_snap_respects_range():
@@ -36,6 +38,100 @@ def test_parse_hal_value_handles_booleans_and_nan():
         HalInterface._parse_hal_value("nan")
 
 
+
+@pytest.mark.parametrize("text, expected", [
+    ("TRUE", 1.0),
+    ("FALSE", 0.0),
+    (" true\n", 1.0),
+    ("No", 0.0),
+    ("42", 42.0),
+    ("-7", -7.0),
+    ("  1500.25\n", 1500.25),
+    ("-0.5", -0.5),
+    ("1e3", 1000.0),
+])
+def test_parse_hal_value_accepts_numbers_and_bit_spellings(text, expected):
+    """Numeric replies parse as floats; bit spellings map to 1.0/0.0."""
+    assert HalInterface._parse_hal_value(text) == expected
+
+
+@pytest.mark.parametrize("text", ["0x1F", "0XFF", "", "   ", "garbage", "1.2.3", "inf", "-Infinity"])
+def test_parse_hal_value_rejects_hex_garbage_and_non_finite(text):
+    """halcmd never prints hex for getp, so hex is rejected along with garbage."""
+    with pytest.raises(ValueError):
+        HalInterface._parse_hal_value(text)
+
+
+class _Clock:
+    """Settable stand-in for time.monotonic()."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting_reads(hal):
+    """Replace the mock pin read with one that returns a new value per read."""
+    reads = []
+
+    def read(pin_name):
+        reads.append(pin_name)
+        return float(len(reads)), True
+
+    hal._get_mock_value = read
+    return reads
+
+
+@pytest.mark.parametrize("jitter_draw", [0.0, 1.0])
+def test_pin_cache_expires_after_jittered_ttl(mock_hal, monkeypatch, jitter_draw):
+    """Cached pins are served until their jittered TTL elapses, then re-read."""
+    clock = _Clock()
+    monkeypatch.setattr(hal_interface.time, "monotonic", clock)
+    monkeypatch.setattr(hal_interface.random, "random", lambda: jitter_draw)
+    reads = _counting_reads(mock_hal)
+
+    # random() == 0 gives the shortest TTL, random() == 1 the longest
+    jitter = HalInterface.CACHE_TTL_JITTER
+    ttl = HalInterface.CACHE_TTL * (1.0 - jitter + 2.0 * jitter * jitter_draw)
+
+    assert mock_hal.get_pin_value("spindle.test") == 1.0
+    clock.now += ttl * 0.99
+    assert mock_hal.get_pin_value("spindle.test") == 1.0
+    assert len(reads) == 1
+
+    clock.now += ttl * 0.02
+    assert mock_hal.get_pin_value("spindle.test") == 2.0
+    assert len(reads) == 2
+
+    # use_cache=False always reads through
+    assert mock_hal.get_pin_value("spindle.test", use_cache=False) == 3.0
+
+
+def test_pin_cache_evicts_least_recently_used_at_cap(mock_hal, monkeypatch):
+    """At CACHE_MAX_ENTRIES the oldest-used pin is evicted first."""
+    monkeypatch.setattr(hal_interface.time, "monotonic", _Clock())
+    monkeypatch.setattr(mock_hal, "CACHE_MAX_ENTRIES", 3)
+    reads = _counting_reads(mock_hal)
+
+    for pin in ("pin.a", "pin.b", "pin.c"):
+        mock_hal.get_pin_value(pin)
+    # A cache hit refreshes pin.a, leaving pin.b as the oldest entry
+    mock_hal.get_pin_value("pin.a")
+    assert len(reads) == 3
+
+    mock_hal.get_pin_value("pin.d")
+    assert list(mock_hal._cache) == ["pin.c", "pin.a", "pin.d"]
+
+    mock_hal.get_pin_value("pin.e")
+    assert list(mock_hal._cache) == ["pin.a", "pin.d", "pin.e"]
+
+    # The evicted pin is read again rather than served from the cache
+    mock_hal.get_pin_value("pin.b")
+    assert reads[-1] == "pin.b"
+    assert len(mock_hal._cache) == 3
+
 def test_mock_rate_limit_slow_start(mock_hal):
     """Mock physics should respect the configured rate limit during acceleration."""
     mock_hal.mock_state.params["RateLimit"] = 100.0
@@ -53,3 +149,48 @@ def test_mock_rate_limit_slow_start(mock_hal):
     # Allow a small tolerance because the simulated timestep is based on monotonic clock
     assert 0 < limited <= max_expected * 1.02
     assert math.isclose(mock_hal.mock_state.limited_cmd, limited, rel_tol=1e-6)
+
+
+FAKE_HALCMD = '''#!{python}
+import sys
+
+pins = {{"spindle.test": "1.5"}}
+
+
+def prompt():
+    sys.stdout.write("%\\n")
+    sys.stdout.flush()
+
+
+prompt()
+for line in sys.stdin:
+    cmd, name, *rest = line.split()
+    if cmd == "setp":
+        pins[name] = rest[0]
+    elif name in pins:
+        sys.stdout.write(pins[name] + "\\n")
+    else:
+        sys.stderr.write(f"HAL: ERROR: pin '{{name}}' not found\\n")
+        sys.stderr.flush()
+    prompt()
+'''
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="select() on pipes needs POSIX")
+def test_halcmd_session_returns_one_reply_per_command(tmp_path):
+    """The persistent halcmd session should keep replies and errors per command."""
+    halcmd = tmp_path / "halcmd"
+    halcmd.write_text(FAKE_HALCMD.format(python=sys.executable))
+    halcmd.chmod(0o755)
+
+    session = HalcmdSession(str(halcmd))
+    try:
+        missing, written, value = session.run_many(
+            ["getp missing.pin", "setp spindle.test 2.5", "getp spindle.test"], timeout=5.0
+        )
+    finally:
+        session.close()
+
+    assert missing.returncode != 0 and "missing.pin" in missing.stderr
+    assert written.returncode == 0 and written.stdout == ""
+    assert value.returncode == 0 and value.stdout == "2.5"
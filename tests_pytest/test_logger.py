@@ -0,0 +1,56 @@
+"""Unit tests for DataLogger plot buffers."""
+
+import pytest
+
+from logger import DataLogger
+
+
+def _fill(logger: DataLogger, count: int) -> None:
+    for i in range(count):
+        logger.add_sample({"cmd_limited": float(i), "feedback": float(-i)})
+
+
+def test_plot_buffers_keep_latest_samples_in_order():
+    logger = DataLogger(buffer_duration_s=0.5)
+    size = logger.buffer_size
+    _fill(logger, size + 3)
+
+    times, traces = logger.get_plot_data()
+    assert len(times) == size
+    assert times == sorted(times)
+    assert traces["cmd"] == [0.0] * size  # "cmd" trace is not in the sample
+    assert traces["feedback"] == [float(-i) for i in range(3, size + 3)]
+
+
+def test_clear_buffers_empties_plot_data():
+    logger = DataLogger(buffer_duration_s=0.5)
+    _fill(logger, 4)
+    logger.clear_buffers()
+
+    times, traces = logger.get_plot_data()
+    assert times == []
+    assert all(values == [] for values in traces.values())
+
+
+def test_plot_data_np_matches_list_view():
+    pytest.importorskip("numpy")
+    logger = DataLogger(buffer_duration_s=0.5)
+    _fill(logger, logger.buffer_size * 2 + 1)
+
+    times, traces = logger.get_plot_data()
+    times_np, traces_np = logger.get_plot_data_np()
+    assert times_np.tolist() == times
+    assert {name: arr.tolist() for name, arr in traces_np.items()} == traces
+
+
+def test_export_csv_writes_header_and_all_rows(tmp_path):
+    logger = DataLogger(buffer_duration_s=0.5)
+    logger.set_recording(True)
+    _fill(logger, 25)
+
+    out = tmp_path / "data.csv"
+    assert logger.export_csv(out)
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("timestamp_iso,time_s,")
+    assert len(lines) == 1 + 25